@@ -7,6 +7,7 @@ from functools import wraps
 from importlib import metadata
 from typing import Awaitable, Callable
 
+import anyio.to_thread
 import requests
 import uvicorn
 from dotenv import find_dotenv, load_dotenv
@@ -87,6 +88,8 @@ TOPOLOGY = config("KEEP_TOPOLOGY_PROCESSOR", default="false", cast=bool)
 KEEP_DEBUG_TASKS = config("KEEP_DEBUG_TASKS", default="false", cast=bool)
 KEEP_DEBUG_MIDDLEWARES = config("KEEP_DEBUG_MIDDLEWARES", default="false", cast=bool)
 KEEP_USE_LIMITER = config("KEEP_USE_LIMITER", default="false", cast=bool)
+# Sync route handlers run in this threadpool, so it bounds the concurrent (DB-bound) requests per worker
+KEEP_API_THREADPOOL_SIZE = config("KEEP_API_THREADPOOL_SIZE", default=40, cast=int)
 
 AUTH_TYPE = config("AUTH_TYPE", default=IdentityManagerTypes.NOAUTH.value).lower()
 try:
@@ -128,6 +131,11 @@ async def startup():
     # https://stackoverflow.com/questions/43944787/sqlalchemy-celery-with-scoped-session-error/54751019#54751019
     dispose_session()
 
+    logger.info(f"Setting the threadpool size to {KEEP_API_THREADPOOL_SIZE}")
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        KEEP_API_THREADPOOL_SIZE
+    )
+
     logger.info("Starting the services")
 
     # Start the scheduler
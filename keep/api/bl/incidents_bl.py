@@ -14,6 +14,7 @@ from sqlmodel import Session
 
 from keep.api.arq_pool import get_pool
 from keep.api.bl.enrichments_bl import EnrichmentsBl
+from keep.api.core.cache import cache_invalidate
 from keep.api.core.db import (
     add_alerts_to_incident_by_incident_id,
     add_audit,
@@ -177,6 +178,8 @@ class IncidentBl:
             raise
 
     def update_client_on_incident_change(self, incident_id: Optional[UUID] = None):
+        # Cached incident lists and metadata are stale now
+        cache_invalidate("incidents", self.tenant_id)
         if self.pusher_client is not None:
             self.logger.info(
                 "Pushing incident change to client",
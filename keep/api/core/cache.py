@@ -0,0 +1,108 @@
+"""
+Short-lived Redis cache for read-heavy API responses (cache-aside).
+
+Entries are keyed by tenant and request parameters. Invalidation bumps a
+per-tenant version counter that is part of every key, so stale entries are
+never read again and simply expire with their TTL.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Optional
+
+import redis
+
+from keep.api.consts import REDIS
+from keep.api.core.config import config
+
+logger = logging.getLogger(__name__)
+
+# "short" tier for lists that change often, "long" tier for slowly changing metadata
+CACHE_TTL_SHORT = config("KEEP_API_CACHE_TTL_SHORT", cast=int, default=15)
+CACHE_TTL_LONG = config("KEEP_API_CACHE_TTL_LONG", cast=int, default=60)
+API_CACHE_ENABLED = REDIS and config("KEEP_API_CACHE_ENABLED", cast=bool, default=True)
+
+_redis_client: Optional[redis.Redis] = None
+
+
+def get_redis_client() -> Optional[redis.Redis]:
+    global _redis_client
+    if not API_CACHE_ENABLED:
+        return None
+    if _redis_client is None:
+        _redis_client = redis.Redis(
+            host=config("REDIS_HOST", default="localhost"),
+            port=config("REDIS_PORT", cast=int, default=6379),
+            username=config("REDIS_USERNAME", default=None),
+            password=config("REDIS_PASSWORD", default=None),
+            # the cache must never slow down a request more than the DB would
+            socket_timeout=1,
+            socket_connect_timeout=1,
+        )
+    return _redis_client
+
+
+def _version_key(namespace: str, tenant_id: str) -> str:
+    return f"{namespace}:{tenant_id}:version"
+
+
+def cache_get(
+    namespace: str, tenant_id: str, params: dict
+) -> tuple[Optional[str], Optional[bytes]]:
+    """
+    Look up a cached response.
+
+    Args:
+        namespace (str): The cache namespace, e.g. "incidents".
+        tenant_id (str): The tenant ID.
+        params (dict): The request parameters the response depends on.
+
+    Returns:
+        tuple[Optional[str], Optional[bytes]]: The cache key to store the response under
+            (None if caching is disabled or Redis is unavailable) and the cached value, if any.
+    """
+    client = get_redis_client()
+    if client is None:
+        return None, None
+    try:
+        version = client.get(_version_key(namespace, tenant_id)) or b"0"
+        digest = hashlib.md5(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        key = f"{namespace}:{tenant_id}:{version.decode()}:{digest}"
+        return key, client.get(key)
+    except redis.RedisError:
+        logger.warning(
+            "Failed to read from cache",
+            exc_info=True,
+            extra={"namespace": namespace, "tenant_id": tenant_id},
+        )
+        return None, None
+
+
+def cache_set(key: Optional[str], value: str | bytes, ttl: int = CACHE_TTL_SHORT):
+    if key is None:
+        return
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        client.setex(key, ttl, value)
+    except redis.RedisError:
+        logger.warning("Failed to write to cache", exc_info=True, extra={"key": key})
+
+
+def cache_invalidate(namespace: str, tenant_id: str):
+    """Drop all cached responses of a namespace for a tenant."""
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        client.incr(_version_key(namespace, tenant_id))
+    except redis.RedisError:
+        logger.warning(
+            "Failed to invalidate cache",
+            exc_info=True,
+            extra={"namespace": namespace, "tenant_id": tenant_id},
+        )
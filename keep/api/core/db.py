@@ -451,7 +451,7 @@ def add_or_update_workflow(
             existing_workflow.interval = interval
             existing_workflow.workflow_raw = workflow_raw
             existing_workflow.revision += 1  # Increment the revision
-            existing_workflow.last_updated = datetime.now()  # Update last_updated
+            existing_workflow.last_updated = datetime.utcnow()  # Update last_updated
             existing_workflow.is_deleted = False
             existing_workflow.is_disabled = is_disabled
             existing_workflow.provisioned = provisioned
@@ -610,16 +610,36 @@ def get_workflows_with_last_execution(tenant_id: str) -> List[dict]:
     return result
 
 
-def get_all_workflows(tenant_id: str) -> List[Workflow]:
+def get_all_workflows(tenant_id: str, include_disabled: bool = True) -> List[Workflow]:
     with Session(engine) as session:
-        workflows = session.exec(
+        query = (
             select(Workflow)
             .where(Workflow.tenant_id == tenant_id)
             .where(Workflow.is_deleted == False)
-        ).all()
+        )
+        if not include_disabled:
+            query = query.where(Workflow.is_disabled == False)
+        workflows = session.exec(query).all()
     return workflows
 
 
+def get_workflows_version(tenant_id: str) -> Tuple[int, Optional[datetime]]:
+    """
+    Get a cheap version of the tenant's workflows.
+
+    Every create, update, toggle and delete bumps the revision of a workflow row,
+    and deleted rows are kept, so the sum of the revisions only ever grows.
+    """
+    with Session(engine) as session:
+        revisions, last_updated = session.exec(
+            select(
+                func.coalesce(func.sum(Workflow.revision), 0),
+                func.max(Workflow.last_updated),
+            ).where(Workflow.tenant_id == tenant_id)
+        ).one()
+    return int(revisions), last_updated
+
+
 def get_all_provisioned_workflows(tenant_id: str) -> List[Workflow]:
     with Session(engine) as session:
         workflows = session.exec(
@@ -840,6 +860,7 @@ def delete_workflow(tenant_id, workflow_id):
 
         if workflow:
             workflow.is_deleted = True
+            workflow.revision += 1
             session.commit()
 
 
@@ -853,6 +874,7 @@ def delete_workflow_by_provisioned_file(tenant_id, provisioned_file):
 
         if workflow:
             workflow.is_deleted = True
+            workflow.revision += 1
             session.commit()
 
 
@@ -982,8 +1004,16 @@ def add_audit(
     user_id: str,
     action: ActionType,
     description: str,
+    session: Optional[Session] = None,
+    autocommit: bool = True,
 ) -> AlertAudit:
-    with Session(engine) as session:
+    """
+    Add an audit record.
+
+    With autocommit=False the record is only flushed, so the caller can commit it
+    in the same transaction as related rows.
+    """
+    with existed_or_new_session(session) as session:
         audit = AlertAudit(
             tenant_id=tenant_id,
             fingerprint=fingerprint,
@@ -992,8 +1022,11 @@ def add_audit(
             description=description,
         )
         session.add(audit)
-        session.commit()
-        session.refresh(audit)
+        if autocommit:
+            session.commit()
+            session.refresh(audit)
+        else:
+            session.flush()
     return audit
 
 
@@ -1851,6 +1884,41 @@ def save_workflow_results(tenant_id, workflow_execution_id, workflow_results):
         session.commit()
 
 
+def save_workflows_results(
+    workflows_results: list[tuple[str, str, dict]],
+) -> set[str]:
+    """
+    Save the results of several workflow executions in one transaction.
+
+    Args:
+        workflows_results (list[tuple[str, str, dict]]): (tenant id, workflow execution id,
+            workflow results) of each execution.
+
+    Returns:
+        set[str]: The ids of the workflow executions whose results were saved.
+    """
+    results_by_execution_id = {
+        workflow_execution_id: (tenant_id, workflow_results)
+        for tenant_id, workflow_execution_id, workflow_results in workflows_results
+    }
+    with Session(engine) as session:
+        workflow_executions = session.exec(
+            select(WorkflowExecution).where(
+                col(WorkflowExecution.id).in_(results_by_execution_id.keys())
+            )
+        ).all()
+
+        saved = set()
+        for workflow_execution in workflow_executions:
+            tenant_id, workflow_results = results_by_execution_id[workflow_execution.id]
+            if workflow_execution.tenant_id != tenant_id:
+                continue
+            workflow_execution.results = workflow_results
+            saved.add(workflow_execution.id)
+        session.commit()
+    return saved
+
+
 def get_workflow_by_name(tenant_id, workflow_name):
     with Session(engine) as session:
         workflow = session.exec(
@@ -3456,6 +3524,9 @@ def filter_query(session: Session, query, field, value):
 def enrich_incidents_with_alerts(
     tenant_id: str, incidents: List[Incident], session: Optional[Session] = None
 ):
+    if not incidents:
+        return incidents
+
     with existed_or_new_session(session) as session:
         incident_alerts = session.exec(
             select(LastAlertToIncident.incident_id, Alert)
@@ -3475,6 +3546,9 @@ def enrich_incidents_with_alerts(
                     [incident.id for incident in incidents]
                 ),
             )
+            # Loaded with the alerts, so converting them to DTOs doesn't
+            # lazy-load the enrichment of every alert one by one
+            .options(joinedload(Alert.alert_enrichment))
         ).all()
 
         alerts_per_incident = defaultdict(list)
@@ -3807,7 +3881,8 @@ def get_incident_alerts_and_links_by_incident_id(
     offset: Optional[int] = 0,
     session: Optional[Session] = None,
     include_unlinked: bool = False,
-) -> tuple[List[tuple[Alert, LastAlertToIncident]], int]:
+    with_total: bool = True,
+) -> tuple[List[tuple[Alert, LastAlertToIncident]], Optional[int]]:
     with existed_or_new_session(session) as session:
 
         query = (
@@ -3836,7 +3911,7 @@ def get_incident_alerts_and_links_by_incident_id(
                 LastAlertToIncident.deleted_at == NULL_FOR_DELETED_AT,
             )
 
-    total_count = query.count()
+    total_count = query.count() if with_total else None
 
     if limit is not None and offset is not None:
         query = query.limit(limit).offset(offset)
@@ -4760,9 +4835,14 @@ def change_incident_status_by_id(
 
 
 def get_workflow_executions_for_incident_or_alert(
-    tenant_id: str, incident_id: str, limit: int = 25, offset: int = 0
+    tenant_id: str,
+    incident_id: str,
+    limit: int = 25,
+    offset: int = 0,
+    with_total: bool = True,
+    session: Optional[Session] = None,
 ):
-    with Session(engine) as session:
+    with existed_or_new_session(session) as session:
         # Base query for both incident and alert related executions
         base_query = (
             select(
@@ -4822,8 +4902,10 @@ def get_workflow_executions_for_incident_or_alert(
         combined_query = union(incident_query, alert_query).subquery()
 
         # Count total results
-        count_query = select(func.count()).select_from(combined_query)
-        total_count = session.execute(count_query).scalar()
+        total_count = None
+        if with_total:
+            count_query = select(func.count()).select_from(combined_query)
+            total_count = session.execute(count_query).scalar()
 
         # Final query with ordering, offset, and limit
         final_query = (
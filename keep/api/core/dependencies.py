@@ -76,6 +76,8 @@ def get_pusher_client() -> Pusher | None:
         secret=pusher_app_secret,
         ssl=False if os.environ.get("PUSHER_USE_SSL", False) is False else True,
         cluster=os.environ.get("PUSHER_CLUSTER"),
+        # notifications are best effort, don't let a slow Pusher hold the caller
+        timeout=int(os.environ.get("PUSHER_TIMEOUT", 2)),
     )
     logging.debug("Pusher client initialized")
     return pusher
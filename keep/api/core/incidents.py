@@ -1,8 +1,11 @@
+import base64
+import json
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Tuple
+from uuid import UUID
 
-from sqlalchemy import and_, case, func, select
+from sqlalchemy import and_, case, desc, func, select, tuple_
 from sqlmodel import Session, col, text
 
 from keep.api.core.alerts import get_alert_potential_facet_fields
@@ -247,6 +250,8 @@ def __build_last_incidents_query(
     is_predicted: bool = None,
     cel: str = None,
     allowed_incident_ids: Optional[List[str]] = None,
+    keyset: bool = False,
+    after: Optional[Tuple[datetime, UUID]] = None,
 ):
     """
     Builds a SQL query to retrieve the last incidents based on various filters and sorting options.
@@ -264,6 +269,10 @@ def __build_last_incidents_query(
         is_predicted (bool, optional): Filter for predicted incidents. Defaults to None.
         cel (str, optional): The CEL (Common Expression Language) string to convert to SQL. Defaults to None.
         allowed_incident_ids (Optional[List[str]], optional): List of allowed incident IDs to filter. Defaults to None.
+        keyset (bool, optional): Order by (creation_time, id) descending and ignore sorting and offset,
+            so pages can be fetched with the `after` position. Defaults to False.
+        after (Optional[Tuple[datetime, UUID]], optional): The (creation_time, id) of the last incident
+            of the previous page, used with keyset. Defaults to None.
 
     Returns:
         sqlalchemy.sql.selectable.Select: The constructed SQL query.
@@ -303,7 +312,13 @@ def __build_last_incidents_query(
     elif lower_timestamp:
         query = query.filter(Incident.last_seen_time >= lower_timestamp)
 
-    if sorting:
+    if keyset:
+        if after:
+            query = query.filter(tuple_(Incident.creation_time, Incident.id) < after)
+        query = query.order_by(desc(Incident.creation_time), desc(Incident.id))
+        sorting = IncidentSorting.creation_time_desc
+        offset = 0
+    elif sorting:
         query = query.order_by(sorting.get_order_by(Incident), Incident.id)
 
     if cel:
@@ -321,7 +336,7 @@ def __build_last_incidents_query(
     return query
 
 
-def get_last_incidents_by_cel(
+def __get_last_incidents(
     tenant_id: str,
     limit: int = 25,
     offset: int = 0,
@@ -334,26 +349,18 @@ def get_last_incidents_by_cel(
     is_predicted: bool = None,
     cel: str = None,
     allowed_incident_ids: Optional[List[str]] = None,
-) -> Tuple[list[Incident], int]:
+    with_total: bool = True,
+    keyset: bool = False,
+    after: Optional[Tuple[datetime, UUID]] = None,
+) -> Tuple[list[Incident], Optional[int], bool]:
     """
-    Retrieve the last incidents for a given tenant based on various filters and criteria.
-    Args:
-        tenant_id (str): The ID of the tenant.
-        limit (int, optional): The maximum number of incidents to return. Defaults to 25.
-        offset (int, optional): The number of incidents to skip before starting to collect the result set. Defaults to 0.
-        timeframe (int, optional): The timeframe in which to look for incidents. Defaults to None.
-        upper_timestamp (datetime, optional): The upper bound timestamp for filtering incidents. Defaults to None.
-        lower_timestamp (datetime, optional): The lower bound timestamp for filtering incidents. Defaults to None.
-        is_candidate (bool, optional): Filter for confirmed incidents. Defaults to False.
-        sorting (Optional[IncidentSorting], optional): The sorting criteria for the incidents. Defaults to IncidentSorting.creation_time.
-        with_alerts (bool, optional): Whether to include alerts in the incidents. Defaults to False.
-        is_predicted (bool, optional): Filter for predicted incidents. Defaults to None.
-        cel (str, optional): The CEL (Common Event Language) filter. Defaults to None.
-        allowed_incident_ids (Optional[List[str]], optional): A list of allowed incident IDs to filter by. Defaults to None.
+    Run the incidents page and total count queries shared by the offset and the
+    keyset pagination, see __build_last_incidents_query for the arguments.
+
     Returns:
-        Tuple[list[Incident], int]: A tuple containing a list of incidents and the total count of incidents.
+        Tuple[list[Incident], Optional[int], bool]: The incidents, the total count
+            (None if with_total is False) and whether a keyset page has a next page.
     """
-
     with Session(engine) as session:
         try:
             total_count_query = __build_last_incidents_total_count_query(
@@ -368,7 +375,8 @@ def get_last_incidents_by_cel(
             )
             sql_query = __build_last_incidents_query(
                 tenant_id=tenant_id,
-                limit=limit,
+                # Fetch one extra row to know whether there is a next page
+                limit=limit + 1 if keyset else limit,
                 offset=offset,
                 timeframe=timeframe,
                 upper_timestamp=upper_timestamp,
@@ -378,25 +386,169 @@ def get_last_incidents_by_cel(
                 is_predicted=is_predicted,
                 cel=cel,
                 allowed_incident_ids=allowed_incident_ids,
+                keyset=keyset,
+                after=after,
             )
         except CelToSqlException as e:
             if isinstance(e.__cause__, PropertiesMappingException):
                 # if there is an error in mapping properties, return empty list
                 logger.error(f"Error mapping properties: {str(e)}")
-                return [], 0
+                return [], 0, False
             raise e
 
-        total_count = session.exec(total_count_query).one()[0]
+        total_count = None
+        if with_total:
+            total_count = session.exec(total_count_query).one()[0]
         all_records = session.exec(sql_query).all()
 
         incidents = [row._asdict().get("Incident") for row in all_records]
 
+        has_more = keyset and len(incidents) > limit
+        if has_more:
+            incidents = incidents[:limit]
+
         if with_alerts:
             enrich_incidents_with_alerts(tenant_id, incidents, session)
 
+    return incidents, total_count, has_more
+
+
+def get_last_incidents_by_cel(
+    tenant_id: str,
+    limit: int = 25,
+    offset: int = 0,
+    timeframe: int = None,
+    upper_timestamp: datetime = None,
+    lower_timestamp: datetime = None,
+    is_candidate: bool = False,
+    sorting: Optional[IncidentSorting] = IncidentSorting.creation_time,
+    with_alerts: bool = False,
+    is_predicted: bool = None,
+    cel: str = None,
+    allowed_incident_ids: Optional[List[str]] = None,
+    with_total: bool = True,
+) -> Tuple[list[Incident], Optional[int]]:
+    """
+    Retrieve the last incidents for a given tenant based on various filters and criteria.
+    Args:
+        tenant_id (str): The ID of the tenant.
+        limit (int, optional): The maximum number of incidents to return. Defaults to 25.
+        offset (int, optional): The number of incidents to skip before starting to collect the result set. Defaults to 0.
+        timeframe (int, optional): The timeframe in which to look for incidents. Defaults to None.
+        upper_timestamp (datetime, optional): The upper bound timestamp for filtering incidents. Defaults to None.
+        lower_timestamp (datetime, optional): The lower bound timestamp for filtering incidents. Defaults to None.
+        is_candidate (bool, optional): Filter for confirmed incidents. Defaults to False.
+        sorting (Optional[IncidentSorting], optional): The sorting criteria for the incidents. Defaults to IncidentSorting.creation_time.
+        with_alerts (bool, optional): Whether to include alerts in the incidents. Defaults to False.
+        is_predicted (bool, optional): Filter for predicted incidents. Defaults to None.
+        cel (str, optional): The CEL (Common Event Language) filter. Defaults to None.
+        allowed_incident_ids (Optional[List[str]], optional): A list of allowed incident IDs to filter by. Defaults to None.
+        with_total (bool, optional): Whether to run the count query for the total. Defaults to True.
+    Returns:
+        Tuple[list[Incident], Optional[int]]: A tuple containing a list of incidents and the total count of incidents
+            (None if with_total is False).
+    """
+    incidents, total_count, _ = __get_last_incidents(
+        tenant_id=tenant_id,
+        limit=limit,
+        offset=offset,
+        timeframe=timeframe,
+        upper_timestamp=upper_timestamp,
+        lower_timestamp=lower_timestamp,
+        is_candidate=is_candidate,
+        sorting=sorting,
+        with_alerts=with_alerts,
+        is_predicted=is_predicted,
+        cel=cel,
+        allowed_incident_ids=allowed_incident_ids,
+        with_total=with_total,
+    )
     return incidents, total_count
 
 
+def encode_incident_cursor(incident: Incident) -> str:
+    """
+    Encode the keyset position of an incident into an opaque, URL-safe cursor.
+    """
+    position = [incident.creation_time.isoformat(), str(incident.id)]
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_incident_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_incident_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        creation_time, incident_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(creation_time), UUID(incident_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def get_last_incidents_by_cursor(
+    tenant_id: str,
+    cursor: Optional[str] = None,
+    limit: int = 25,
+    timeframe: int = None,
+    upper_timestamp: datetime = None,
+    lower_timestamp: datetime = None,
+    is_candidate: bool = False,
+    with_alerts: bool = False,
+    is_predicted: bool = None,
+    cel: str = None,
+    allowed_incident_ids: Optional[List[str]] = None,
+    with_total: bool = True,
+) -> Tuple[list[Incident], Optional[int], Optional[str]]:
+    """
+    Retrieve the last incidents for a given tenant using keyset (cursor) pagination.
+
+    Incidents are ordered by creation_time and id, newest first. Unlike offset
+    pagination, the cost of fetching a page doesn't grow with its depth, since the
+    database seeks straight to the cursor position instead of skipping rows.
+
+    Args:
+        tenant_id (str): The ID of the tenant.
+        cursor (Optional[str], optional): The next_cursor returned with the previous page,
+            or None for the first page. Defaults to None.
+        limit (int, optional): The maximum number of incidents to return. Defaults to 25.
+        timeframe (int, optional): The timeframe in which to look for incidents. Defaults to None.
+        upper_timestamp (datetime, optional): The upper bound timestamp for filtering incidents. Defaults to None.
+        lower_timestamp (datetime, optional): The lower bound timestamp for filtering incidents. Defaults to None.
+        is_candidate (bool, optional): Filter for confirmed incidents. Defaults to False.
+        with_alerts (bool, optional): Whether to include alerts in the incidents. Defaults to False.
+        is_predicted (bool, optional): Filter for predicted incidents. Defaults to None.
+        cel (str, optional): The CEL (Common Event Language) filter. Defaults to None.
+        allowed_incident_ids (Optional[List[str]], optional): A list of allowed incident IDs to filter by. Defaults to None.
+        with_total (bool, optional): Whether to run the count query for the total. Defaults to True.
+    Returns:
+        Tuple[list[Incident], Optional[int], Optional[str]]: A tuple containing a list of incidents, the total count
+            of incidents (None if with_total is False) and the cursor of the next page (None if this is the last page).
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    after = decode_incident_cursor(cursor) if cursor else None
+    incidents, total_count, has_more = __get_last_incidents(
+        tenant_id=tenant_id,
+        limit=limit,
+        timeframe=timeframe,
+        upper_timestamp=upper_timestamp,
+        lower_timestamp=lower_timestamp,
+        is_candidate=is_candidate,
+        with_alerts=with_alerts,
+        is_predicted=is_predicted,
+        cel=cel,
+        allowed_incident_ids=allowed_incident_ids,
+        with_total=with_total,
+        keyset=True,
+        after=after,
+    )
+    next_cursor = encode_incident_cursor(incidents[-1]) if has_more else None
+    return incidents, total_count, next_cursor
+
+
 def get_incident_facets_data(
     tenant_id: str,
     allowed_incident_ids: list[str],
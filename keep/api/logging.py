@@ -1,3 +1,4 @@
+import contextvars
 import http.client
 import inspect
 import logging
@@ -26,46 +27,66 @@ KEEP_STORE_WORKFLOW_LOGS = (
 
 logger = logging.getLogger(__name__)
 
+# The workflow run context, set by the workflow manager for the thread (or task)
+# running the workflow and read by WorkflowContextFilter.
+workflow_id_var: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "workflow_id", default=None
+)
+workflow_execution_id_var: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "workflow_execution_id", default=None
+)
+workflow_debug_var: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "workflow_debug", default=False
+)
+tenant_id_var: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "tenant_id", default=None
+)
+provider_type_var: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "provider_type", default=None
+)
+step_id_var: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "step_id", default=None
+)
+
 
 class WorkflowContextFilter(logging.Filter):
     """
     This is part of the root logger configuration.
 
-    It filters out log records that don't have a workflow_id in the thread context.
+    It filters out log records that don't have a workflow_id in the workflow context.
     """
 
     def filter(self, record):
-        # Get workflow_id and debug flag from thread context
-        thread = threading.current_thread()
-        workflow_id = getattr(thread, "workflow_id", None)
+        # Get workflow_id and debug flag from the workflow context
+        workflow_id = workflow_id_var.get()
 
         # Early return if no workflow_id
         if not workflow_id:
             return False
 
         # Skip DEBUG logs unless debug mode is enabled
-        if not getattr(thread, "workflow_debug", False) and record.levelname == "DEBUG":
+        if not workflow_debug_var.get() and record.levelname == "DEBUG":
             return False
 
         # Initialize record.extra if needed
         if not hasattr(record, "extra"):
             record.extra = {}
 
-        # Get thread context attributes
-        thread_attrs = {
+        # Get workflow context attributes
+        context_attrs = {
             "workflow_id": workflow_id,
-            "workflow_execution_id": getattr(thread, "workflow_execution_id", None),
-            "tenant_id": getattr(thread, "tenant_id", None),
-            "provider_type": getattr(thread, "provider_type", None),
+            "workflow_execution_id": workflow_execution_id_var.get(),
+            "tenant_id": tenant_id_var.get(),
+            "provider_type": provider_type_var.get(),
         }
 
-        # Set record attributes from thread context
-        for attr, value in thread_attrs.items():
+        # Set record attributes from the workflow context
+        for attr, value in context_attrs.items():
             if value is not None:
                 setattr(record, attr, value)
 
         # Handle step_id
-        step_id = getattr(thread, "step_id", None)
+        step_id = step_id_var.get()
         if step_id is not None:
             record.context = {"step_id": step_id}
 
@@ -1,26 +1,33 @@
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import Index
-from sqlmodel import Field, Relationship, SQLModel
+from sqlalchemy import DateTime, Index
+from sqlmodel import Column, Field, Relationship, SQLModel, func
 
 
 class CommentMention(SQLModel, table=True):
     """
     Model for storing user mentions in comments.
     """
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    # Sequential key, keeps the PK index compact and inserts append-only
+    id: Optional[int] = Field(default=None, primary_key=True)
     tenant_id: str = Field(foreign_key="tenant.id", nullable=False)
     comment_id: UUID = Field(foreign_key="alertaudit.id", nullable=False)
     user_id: str = Field(nullable=False)  # Email of the mentioned user
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Filled by the DB, so bulk inserts don't need to send it
+    created_at: datetime = Field(
+        sa_column=Column(
+            DateTime(timezone=True), server_default=func.now(), nullable=False
+        )
+    )
     
     # Define relationships if needed
     # comment: AlertAudit = Relationship(back_populates="mentions")
     
     __table_args__ = (
-        Index("ix_comment_mention_tenant_id", "tenant_id"),
+        # Mentions of a comment: "tenant_id" lookups are served by the leading column
+        Index("ix_comment_mention_tenant_comment", "tenant_id", "comment_id"),
         Index("ix_comment_mention_comment_id", "comment_id"),
         Index("ix_comment_mention_user_id", "user_id"),
         Index("ix_comment_mention_tenant_user", "tenant_id", "user_id"),
@@ -178,6 +178,13 @@ class Incident(SQLModel, table=True):
             postgresql_where=text("running_number IS NOT NULL"),  # For PostgreSQL
             sqlite_where=text("running_number IS NOT NULL"),  # For SQLite
         ),
+        # Serves keyset (cursor) pagination of the incidents list
+        Index(
+            "ix_incident_tenant_creation_time_id",
+            "tenant_id",
+            "creation_time",
+            "id",
+        ),
     )
 
     @property
@@ -11,6 +11,7 @@ from keep.api.core.db_utils import create_db_engine
 from keep.api.models.db.action import *
 from keep.api.models.db.ai_suggestion import *
 from keep.api.models.db.alert import *
+from keep.api.models.db.comment_mention import *
 from keep.api.models.db.dashboard import *
 from keep.api.models.db.extraction import *
 from keep.api.models.db.facet import *
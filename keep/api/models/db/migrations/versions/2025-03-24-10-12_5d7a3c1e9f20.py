@@ -0,0 +1,29 @@
+"""Add incident (tenant_id, creation_time, id) index
+
+Revision ID: 5d7a3c1e9f20
+Revises: 971abbbf0a2c
+Create Date: 2025-03-24 10:12:04.118204
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5d7a3c1e9f20"
+down_revision = "971abbbf0a2c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("incident", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_incident_tenant_creation_time_id",
+            ["tenant_id", "creation_time", "id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("incident", schema=None) as batch_op:
+        batch_op.drop_index("ix_incident_tenant_creation_time_id")
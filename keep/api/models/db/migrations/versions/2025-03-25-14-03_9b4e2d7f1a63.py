@@ -0,0 +1,60 @@
+"""Add commentmention table
+
+Revision ID: 9b4e2d7f1a63
+Revises: 5d7a3c1e9f20
+Create Date: 2025-03-25 14:03:52.640117
+
+"""
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b4e2d7f1a63"
+down_revision = "5d7a3c1e9f20"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "commentmention",
+        sa.Column("id", sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+        sa.Column("tenant_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("comment_id", sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+        sa.Column("user_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["comment_id"],
+            ["alertaudit.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["tenant_id"],
+            ["tenant.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("commentmention", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_comment_mention_tenant_comment",
+            ["tenant_id", "comment_id"],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_comment_mention_comment_id", ["comment_id"], unique=False
+        )
+        batch_op.create_index("ix_comment_mention_user_id", ["user_id"], unique=False)
+        batch_op.create_index(
+            "ix_comment_mention_tenant_user", ["tenant_id", "user_id"], unique=False
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("commentmention", schema=None) as batch_op:
+        batch_op.drop_index("ix_comment_mention_tenant_user")
+        batch_op.drop_index("ix_comment_mention_user_id")
+        batch_op.drop_index("ix_comment_mention_comment_id")
+        batch_op.drop_index("ix_comment_mention_tenant_comment")
+
+    op.drop_table("commentmention")
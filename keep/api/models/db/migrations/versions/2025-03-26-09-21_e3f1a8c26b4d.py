@@ -0,0 +1,38 @@
+"""Fill commentmention.created_at in the DB
+
+Revision ID: e3f1a8c26b4d
+Revises: 9b4e2d7f1a63
+Create Date: 2025-03-26 09:21:17.305948
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e3f1a8c26b4d"
+down_revision = "9b4e2d7f1a63"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("commentmention", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            type_=sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("commentmention", schema=None) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(timezone=True),
+            type_=sa.DateTime(),
+            server_default=None,
+            existing_nullable=False,
+        )
@@ -0,0 +1,104 @@
+"""Use an integer primary key for commentmention
+
+Revision ID: 7c2d5e9a4b18
+Revises: e3f1a8c26b4d
+Create Date: 2025-03-27 11:48:33.201574
+
+"""
+
+from uuid import uuid4
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7c2d5e9a4b18"
+down_revision = "e3f1a8c26b4d"
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "ix_comment_mention_tenant_comment": ["tenant_id", "comment_id"],
+    "ix_comment_mention_comment_id": ["comment_id"],
+    "ix_comment_mention_user_id": ["user_id"],
+    "ix_comment_mention_tenant_user": ["tenant_id", "user_id"],
+}
+
+
+def _create_commentmention_table(name: str, id_column: sa.Column):
+    op.create_table(
+        name,
+        id_column,
+        sa.Column("tenant_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("comment_id", sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+        sa.Column("user_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["comment_id"],
+            ["alertaudit.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["tenant_id"],
+            ["tenant.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def _replace_commentmention_table():
+    # Indexes are dropped with the old table and recreated under the same names
+    op.drop_table("commentmention")
+    op.rename_table("commentmention_new", "commentmention")
+    with op.batch_alter_table("commentmention", schema=None) as batch_op:
+        for index_name, columns in INDEXES.items():
+            batch_op.create_index(index_name, columns, unique=False)
+
+
+def upgrade() -> None:
+    _create_commentmention_table(
+        "commentmention_new",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+    )
+
+    # Copy existing data, ids are assigned in insertion order
+    op.execute(
+        """
+            INSERT INTO commentmention_new (tenant_id, comment_id, user_id, created_at)
+            SELECT tenant_id, comment_id, user_id, created_at FROM commentmention
+            ORDER BY created_at;
+        """
+    )
+
+    _replace_commentmention_table()
+
+
+def downgrade() -> None:
+    _create_commentmention_table(
+        "commentmention_new",
+        sa.Column("id", sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+    )
+
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text(
+            "SELECT tenant_id, comment_id, user_id, created_at FROM commentmention"
+        )
+    ).mappings()
+    commentmention_new = sa.table(
+        "commentmention_new",
+        sa.column("id", sqlmodel.sql.sqltypes.types.Uuid()),
+        sa.column("tenant_id"),
+        sa.column("comment_id"),
+        sa.column("user_id"),
+        sa.column("created_at"),
+    )
+    # UUIDs can't be generated portably in SQL
+    op.bulk_insert(commentmention_new, [{"id": uuid4(), **row} for row in rows])
+
+    _replace_commentmention_table()
@@ -722,7 +722,8 @@ async def update_workflow_by_id(
     workflow_from_db.interval = workflow_interval
     workflow_from_db.is_disabled = workflow.get("disabled", False)
     workflow_from_db.workflow_raw = cyaml.dump(workflow, width=99999)
-    workflow_from_db.last_updated = datetime.datetime.now()
+    workflow_from_db.revision += 1
+    workflow_from_db.last_updated = datetime.datetime.utcnow()
     session.add(workflow_from_db)
     session.commit()
     session.refresh(workflow_from_db)
@@ -1015,7 +1016,8 @@ def toggle_workflow_state(
 
     # Toggle the disabled state
     workflow.is_disabled = not workflow.is_disabled
-    workflow.last_updated = datetime.datetime.now()
+    workflow.revision += 1
+    workflow.last_updated = datetime.datetime.utcnow()
 
     session.add(workflow)
     session.commit()
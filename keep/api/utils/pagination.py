@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 
 from pydantic import BaseModel
 
@@ -18,6 +18,10 @@ class PaginatedResultsDto(BaseModel):
 
 class IncidentsPaginatedResultsDto(PaginatedResultsDto):
     items: list[IncidentDto]
+    # None when the total wasn't requested
+    count: Optional[int] = None
+    # Set when the page was fetched with a cursor and more incidents follow
+    next_cursor: Optional[str] = None
 
 
 class AlertPaginatedResultsDto(PaginatedResultsDto):
@@ -30,11 +34,22 @@ class EnrichmentEventPaginatedResultsDto(PaginatedResultsDto):
 
 class AlertWithIncidentLinkMetadataPaginatedResultsDto(PaginatedResultsDto):
     items: list[AlertWithIncidentLinkMetadataDto]
+    # None when the total wasn't requested
+    count: Optional[int] = None
 
 
 class WorkflowExecutionsPaginatedResultsDto(PaginatedResultsDto):
     items: list[WorkflowExecutionDTO]
+    # None when the total wasn't requested
+    count: Optional[int] = None
     passCount: int = 0
     avgDuration: float = 0.0
     workflow: Optional[WorkflowDTO] = None
     failCount: int = 0
+
+
+class IncidentWithRelationsDto(BaseModel):
+    incident: IncidentDto
+    # Set only when requested with ?include=
+    alerts: Optional[AlertWithIncidentLinkMetadataPaginatedResultsDto] = None
+    workflows: Optional[WorkflowExecutionsPaginatedResultsDto] = None
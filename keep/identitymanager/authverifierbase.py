@@ -1,7 +1,12 @@
 import datetime
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
 
+import jwt
 from fastapi import Depends, HTTPException, Request, Security
 from fastapi.security import (
     APIKeyHeader,
@@ -22,6 +27,15 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
 
 ALL_RESOURCES = set()
 
+# Verified bearer tokens are cached for a short while, so repeated requests with the
+# same token skip signature verification and permission lookups (0 disables it)
+AUTH_CACHE_TTL = config("KEEP_AUTH_CACHE_TTL", cast=int, default=60)
+AUTH_CACHE_MAX_SIZE = config("KEEP_AUTH_CACHE_MAX_SIZE", cast=int, default=10000)
+
+# sha256 of (verifier, scopes, token) -> (expiry, authenticated entity)
+_verified_tokens: OrderedDict[str, tuple[float, AuthenticatedEntity]] = OrderedDict()
+_verified_tokens_lock = threading.Lock()
+
 
 def get_all_scopes() -> list[str]:
     """
@@ -58,9 +72,13 @@ class AuthVerifierBase:
     Attributes:
         scopes (list[str]): A list of required scopes for authorization.
         logger (logging.Logger): Logger for this class.
+        cache_verified_tokens (bool): Whether verified bearer tokens may be cached.
+            Verifiers that authenticate from other request data should disable it.
 
     """
 
+    cache_verified_tokens = True
+
     def __init__(self, scopes: list[str] = []) -> None:
         ALL_RESOURCES.update([scope.split(":")[1] for scope in scopes])
         self.scopes = scopes
@@ -123,6 +141,12 @@ class AuthVerifierBase:
                     detail="Read only instance, but non-read scopes requested",
                 )
 
+        cache_key = self._get_token_cache_key(token)
+        authenticated_entity = self._get_cached_entity(cache_key)
+        if authenticated_entity:
+            self.logger.debug("Authenticated and authorized from cache")
+            return authenticated_entity
+
         authenticated_entity = self.authenticate(request, api_key, authorization, token)
         self.logger.debug(
             f"Authentication successful for entity: {authenticated_entity}"
@@ -132,8 +156,77 @@ class AuthVerifierBase:
         self.authorize(authenticated_entity)
         self.logger.debug("Authorization successful")
 
+        self._cache_entity(cache_key, authenticated_entity, token)
         return authenticated_entity
 
+    def _get_token_cache_key(self, token: Optional[str]) -> Optional[str]:
+        """
+        Get the cache key of a bearer token, None if it shouldn't be cached.
+
+        The key covers the verifier and its scopes, since authorization is cached too.
+        """
+        if not token or not self.cache_verified_tokens or AUTH_CACHE_TTL <= 0:
+            return None
+        return hashlib.sha256(
+            f"{type(self).__name__}:{','.join(self.scopes)}:{token}".encode()
+        ).hexdigest()
+
+    @staticmethod
+    def _get_cached_entity(cache_key: Optional[str]) -> Optional[AuthenticatedEntity]:
+        if cache_key is None:
+            return None
+        with _verified_tokens_lock:
+            cached = _verified_tokens.get(cache_key)
+            if cached is None:
+                return None
+            expires_at, authenticated_entity = cached
+            if expires_at < time.monotonic():
+                del _verified_tokens[cache_key]
+                return None
+            _verified_tokens.move_to_end(cache_key)
+            return authenticated_entity
+
+    @staticmethod
+    def _get_token_ttl(token: str) -> float:
+        """
+        Get how long a verified token can be cached, capped by its "exp" claim.
+
+        Tokens that aren't JWTs or don't expire are cached for AUTH_CACHE_TTL.
+        """
+        try:
+            # the token was already verified, only its claims are needed here
+            expires_at = jwt.decode(token, options={"verify_signature": False}).get(
+                "exp"
+            )
+        except Exception:
+            return AUTH_CACHE_TTL
+        if expires_at is None:
+            return AUTH_CACHE_TTL
+        return min(AUTH_CACHE_TTL, float(expires_at) - time.time())
+
+    @classmethod
+    def _cache_entity(
+        cls,
+        cache_key: Optional[str],
+        authenticated_entity: AuthenticatedEntity,
+        token: Optional[str] = None,
+    ) -> None:
+        if cache_key is None:
+            return
+        ttl = cls._get_token_ttl(token) if token else AUTH_CACHE_TTL
+        if ttl <= 0:
+            # already expired, verify it again on the next request
+            return
+        with _verified_tokens_lock:
+            _verified_tokens[cache_key] = (
+                time.monotonic() + ttl,
+                authenticated_entity,
+            )
+            _verified_tokens.move_to_end(cache_key)
+            # evict the least recently used tokens
+            while len(_verified_tokens) > AUTH_CACHE_MAX_SIZE:
+                _verified_tokens.popitem(last=False)
+
     def authenticate(
         self,
         request: Request,
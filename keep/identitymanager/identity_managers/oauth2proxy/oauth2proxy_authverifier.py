@@ -19,6 +19,9 @@ from keep.identitymanager.rbac import get_role_by_role_name
 class Oauth2proxyAuthVerifier(AuthVerifierBase):
     """Handles authentication and authorization for single tenant mode"""
 
+    # the user comes from the proxy headers, not from the bearer token
+    cache_verified_tokens = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.oauth2_proxy_user_header = config(
@@ -562,7 +562,9 @@ class KeepProvider(BaseProvider):
     def _delete_workflows(self, except_workflow_id=None):
         self.logger.info("Deleting all workflows")
         workflow_store = WorkflowStore()
-        workflows = workflow_store.get_all_workflows(self.context_manager.tenant_id)
+        workflows = workflow_store.get_all_workflows(
+            self.context_manager.tenant_id, include_disabled=True
+        )
         for workflow in workflows:
             if not (except_workflow_id and workflow.id == except_workflow_id):
                 self.logger.info(f"Deleting workflow {workflow.id}")
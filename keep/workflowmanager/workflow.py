@@ -1,8 +1,9 @@
 import enum
+import itertools
 import logging
-import threading
 import typing
 
+from keep.api.logging import step_id_var
 from keep.contextmanager.contextmanager import ContextManager
 from keep.iohandler.iohandler import IOHandler
 from keep.step.step import Step, StepError
@@ -59,11 +60,16 @@ class Workflow:
         self.logger = logging.getLogger(__name__)
         self.workflow_debug = workflow_debug
 
+    def iter_named_results(self) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+        """Yield (name, results) of the actions and then the steps, in one pass."""
+        for step in itertools.chain(self.workflow_actions, self.workflow_steps or []):
+            yield step.name, step.provider.results
+
     def run_steps(self):
         self.logger.debug(f"Running steps for workflow {self.workflow_id}")
         for step in self.workflow_steps:
             try:
-                threading.current_thread().step_id = step.step_id
+                step_id_var.set(step.step_id)
                 self.logger.info(
                     "Running step %s",
                     step.step_id,
@@ -76,7 +82,7 @@ class Workflow:
                         step.step_id,
                         extra={"step_id": step.step_id},
                     )
-                    threading.current_thread().step_id = None
+                    step_id_var.set(None)
                 # if the step ran + the step configured to stop the workflow:
                 if step_ran and not step.continue_to_next_step:
                     self.logger.info(
@@ -87,7 +93,7 @@ class Workflow:
                     break
             except StepError as e:
                 self.logger.error(f"Step {step.step_id} failed: {e}")
-                threading.current_thread().step_id = None
+                step_id_var.set(None)
                 raise
         self.logger.debug(f"Steps for workflow {self.workflow_id} ran successfully")
 
@@ -134,9 +140,9 @@ class Workflow:
         actions_firing = []
         actions_errors = []
         for action in self.workflow_actions:
-            threading.current_thread().step_id = action.step_id
+            step_id_var.set(action.step_id)
             action_status, action_error, action_stop = self.run_action(action)
-            threading.current_thread().step_id = None
+            step_id_var.set(None)
             if action_error:
                 actions_firing.append(action_status)
                 actions_errors.append(action_error)
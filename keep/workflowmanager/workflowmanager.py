@@ -1,6 +1,7 @@
+import asyncio
+import functools
 import logging
 import os
-import re
 import threading
 import typing
 import uuid
@@ -9,26 +10,63 @@ from keep.api.core.config import config
 from keep.api.core.db import (
     get_enrichment,
     get_previous_alert_by_fingerprint,
-    save_workflow_results,
 )
 from keep.api.core.metrics import workflow_execution_duration
+from keep.api.logging import (
+    tenant_id_var,
+    workflow_debug_var,
+    workflow_execution_id_var,
+    workflow_id_var,
+)
 from keep.api.models.alert import AlertDto, AlertSeverity
 from keep.api.models.incident import IncidentDto
 from keep.identitymanager.identitymanagerfactory import IdentityManagerTypes
 from keep.providers.providers_factory import ProviderConfigurationException
 from keep.workflowmanager.workflow import Workflow
+from keep.workflowmanager.workflowresultsbatcher import WorkflowResultsBatcher
 from keep.workflowmanager.workflowscheduler import WorkflowScheduler, timing_histogram
-from keep.workflowmanager.workflowstore import WorkflowStore
+from keep.workflowmanager.workflowstore import (
+    WorkflowStore,
+    _apply_equality_filter,
+    _apply_regex_filter,
+    _compile_filter_regex,
+)
+
+IS_MULTI_TENANT = os.environ.get("AUTH_TYPE", IdentityManagerTypes.NOAUTH.value) in (
+    IdentityManagerTypes.AUTH0.value,
+    "MULTI_TENANT",  # backward compatibility
+)
+
+
+def _generate_workflow_execution_ids(n: int) -> list[str]:
+    """Generate n random (version 4) UUIDs from a single os.urandom call."""
+    random_bytes = os.urandom(16 * n)
+    return [
+        str(uuid.UUID(bytes=random_bytes[i : i + 16], version=4))
+        for i in range(0, 16 * n, 16)
+    ]
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_filter_key(filter_key: str) -> tuple[str, tuple[str, ...]]:
+    """Split a filter key once into the event attribute and the nested dict keys."""
+    attr, *keys = filter_key.split(".")
+    return attr, tuple(keys)
 
 
 class WorkflowManager:
-    # List of providers that are not allowed to be used in workflows in multi tenant mode.
-    PREMIUM_PROVIDERS = ["bash", "python", "llamacpp", "ollama"]
+    # Providers that are not allowed to be used in workflows in multi tenant mode.
+    PREMIUM_PROVIDERS = frozenset({"bash", "python", "llamacpp", "ollama"})
+
+    _instance_lock = threading.Lock()
 
     @staticmethod
     def get_instance() -> "WorkflowManager":
+        # double-checked, so concurrent first callers don't create two managers
         if not hasattr(WorkflowManager, "_instance"):
-            WorkflowManager._instance = WorkflowManager()
+            with WorkflowManager._instance_lock:
+                if not hasattr(WorkflowManager, "_instance"):
+                    WorkflowManager._instance = WorkflowManager()
         return WorkflowManager._instance
 
     def __init__(self):
@@ -39,6 +77,7 @@ class WorkflowManager:
 
         self.scheduler = WorkflowScheduler(self)
         self.workflow_store = WorkflowStore()
+        self.results_batcher = WorkflowResultsBatcher()
         self.started = False
 
     async def start(self):
@@ -55,6 +94,8 @@ class WorkflowManager:
         if not self.started:
             return
         self.scheduler.stop()
+        # save the results of the workflows that just finished
+        self.results_batcher.stop()
         self.started = False
         # Clear the scheduler reference
         self.scheduler = None
@@ -62,21 +103,10 @@ class WorkflowManager:
     def _apply_filter(self, filter_val, value):
         # if it's a regex, apply it
         if isinstance(filter_val, str) and filter_val.startswith('r"'):
-            try:
-                # remove the r" and the last "
-                pattern = re.compile(filter_val[2:-1])
-                return pattern.findall(value)
-            except Exception as e:
-                self.logger.error(
-                    f"Error applying regex filter: {filter_val} on value: {value}",
-                    extra={"exception": e},
-                )
-                return False
-        else:
-            # For cases like `dismissed`
-            if isinstance(filter_val, bool) and isinstance(value, str):
-                return value == str(filter_val)
-            return value == filter_val
+            return _apply_regex_filter(
+                _compile_filter_regex(filter_val), value, filter_val=filter_val
+            )
+        return _apply_equality_filter(filter_val, value)
 
     def _get_workflow_from_store(self, tenant_id, workflow_model):
         try:
@@ -106,6 +136,8 @@ class WorkflowManager:
         """
         Insert a user_assigned event into the workflow manager.
         This is triggered when a user is mentioned in a comment.
+
+        Kept for a single mentioned user, see insert_user_assigned_event_batch.
         
         Args:
             tenant_id (str): The tenant ID
@@ -116,6 +148,28 @@ class WorkflowManager:
                 - mentioned_by: The user who mentioned
                 - comment_text: The full comment text
         """
+        batch_data = {key: value for key, value in data.items() if key != "mentioned_user"}
+        batch_data["mentioned_users"] = [data.get("mentioned_user")]
+        self.insert_user_assigned_event_batch(tenant_id, batch_data)
+
+    def insert_user_assigned_event_batch(self, tenant_id: str, data: dict):
+        """
+        Insert a user_assigned event for all the users mentioned in a comment.
+
+        The workflows are loaded and matched once for all the users. A workflow runs
+        once per mentioned user matching its filters, with the user in `mentioned_user`,
+        unless its trigger sets `group_mentions: true`, in which case it runs once with
+        all the matching users in `mentioned_users`.
+
+        Args:
+            tenant_id (str): The tenant ID
+            data (dict): Data about the mentions including:
+                - incident_id: The incident ID
+                - comment_id: The comment ID
+                - mentioned_users: The users who were mentioned
+                - mentioned_by: The user who mentioned
+                - comment_text: The full comment text
+        """
         self.logger.info(
             "Processing user_assigned event",
             extra={
@@ -123,173 +177,131 @@ class WorkflowManager:
                 "data": data,
             },
         )
+        mentioned_users = data.get("mentioned_users") or []
         
-        all_workflow_models = self.workflow_store.get_all_workflows(tenant_id)
+        workflows = self.workflow_store.get_workflows_by_trigger_type(
+            tenant_id, "user_assigned"
+        )
         self.logger.info(
-            "Got all workflows",
+            "Got workflows with user_assigned triggers",
             extra={
-                "num_of_workflows": len(all_workflow_models),
+                "num_of_workflows": len(workflows),
             },
         )
         
-        for workflow_model in all_workflow_models:
-            if workflow_model.is_disabled:
+        for workflow_model, user_assigned_triggers in workflows:
+            # Filters are compiled once per workflow, evaluated for each user's event
+            matched_users = [
+                mentioned_user
+                for mentioned_user in mentioned_users
+                if any(
+                    trigger.matches({**data, "mentioned_user": mentioned_user})
+                    for trigger in user_assigned_triggers
+                )
+            ]
+            if not matched_users:
                 self.logger.debug(
-                    f"Skipping the workflow: id={workflow_model.id}, name={workflow_model.name}, "
-                    f"tenant_id={workflow_model.tenant_id} - Workflow is disabled."
+                    "Workflow %s filters didn't match, skipping", workflow_model.id
                 )
                 continue
-                
+
             workflow = self._get_workflow_from_store(tenant_id, workflow_model)
             if workflow is None:
                 continue
-                
-            # Check if the workflow has a user_assigned trigger
-            user_assigned_triggers = []
-            for trigger in workflow.workflow_triggers or []:
-                if trigger.get("type") == "user_assigned":
-                    user_assigned_triggers.append(trigger)
-            
-            if not user_assigned_triggers:
-                self.logger.debug(
-                    f"Workflow {workflow_model.id} does not have user_assigned triggers, skipping"
+
+            if any(trigger.group_mentions for trigger in user_assigned_triggers):
+                events = [{**data, "mentioned_users": matched_users}]
+            else:
+                events = [
+                    {**data, "mentioned_user": mentioned_user}
+                    for mentioned_user in matched_users
+                ]
+
+            # Add the workflow to run, the extra is only built if it's logged
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Adding workflow %s to run for user_assigned event",
+                    workflow_model.id,
+                    extra={
+                        "workflow_id": workflow_model.id,
+                        "tenant_id": tenant_id,
+                        "data": data,
+                        "runs": len(events),
+                    },
                 )
-                continue
-                
-            # Check if the workflow should be triggered based on filters
-            should_run = False
-            for trigger in user_assigned_triggers:
-                should_run = True  # Default to run unless a filter excludes it
-                
-                # Apply filters if any
-                for filter in trigger.get("filters", []):
-                    filter_key = filter.get("key")
-                    filter_val = filter.get("value")
-                    filter_exclude = filter.get("exclude", False)
-                    
-                    # Get the value from the data
-                    if filter_key in data:
-                        event_val = data[filter_key]
-                        
-                        # Apply the filter
-                        filter_applied = self._apply_filter(filter_val, event_val)
-                        
-                        # If filter doesn't match and it's not an exclusion filter, don't run
-                        if not filter_applied and not filter_exclude:
-                            should_run = False
-                            break
-                            
-                        # If filter matches and it's an exclusion filter, don't run
-                        if filter_applied and filter_exclude:
-                            should_run = False
-                            break
-                    else:
-                        # If the filter key doesn't exist in the data, don't run
-                        should_run = False
-                        break
-                
-                # If this trigger should run, no need to check other triggers
-                if should_run:
-                    break
-            
-            if not should_run:
-                self.logger.debug(f"Workflow {workflow_model.id} filters didn't match, skipping")
-                continue
-                
-            # Add the workflow to run
-            self.logger.info(
-                f"Adding workflow {workflow_model.id} to run for user_assigned event",
-                extra={
-                    "workflow_id": workflow_model.id,
-                    "tenant_id": tenant_id,
-                    "data": data,
-                },
-            )
             
-            with self.scheduler.lock:
-                self.scheduler.workflows_to_run.append(
+            for event in events:
+                self.scheduler.workflows_to_run.put(
                     {
                         "workflow": workflow,
                         "workflow_id": workflow_model.id,
                         "tenant_id": tenant_id,
                         "triggered_by": "user_assigned",
-                        "event": data,  # Pass the data as the event
+                        "event": event,  # Pass the data as the event
                     }
                 )
             
-            self.logger.info(f"Workflow {workflow_model.id} added to run")
+            self.logger.info("Workflow %s added to run", workflow_model.id)
 
     def insert_incident(self, tenant_id: str, incident: IncidentDto, trigger: str):
-        all_workflow_models = self.workflow_store.get_all_workflows(tenant_id)
+        workflows = self.workflow_store.get_workflows_by_trigger_type(
+            tenant_id, "incident"
+        )
         self.logger.info(
-            "Got all workflows",
+            "Got workflows with incident triggers",
             extra={
-                "num_of_workflows": len(all_workflow_models),
+                "num_of_workflows": len(workflows),
             },
         )
-        for workflow_model in all_workflow_models:
-
-            if workflow_model.is_disabled:
+        # the enrichments depend on the incident only, fetch them once for all workflows
+        incident_enriched = False
+        for workflow_model, triggers in workflows:
+            if not any(
+                trigger in incident_trigger.events for incident_trigger in triggers
+            ):
                 self.logger.debug(
-                    f"Skipping the workflow: id={workflow_model.id}, name={workflow_model.name}, "
-                    f"tenant_id={workflow_model.tenant_id} - Workflow is disabled."
+                    "workflow does not contain trigger %s, skipping", trigger
                 )
                 continue
+
             workflow = self._get_workflow_from_store(tenant_id, workflow_model)
             if workflow is None:
                 continue
 
-            # Using list comprehension instead of pandas flatten() for better performance
-            # and to avoid pandas dependency
-            # @tb: I removed pandas so if we'll have performance issues we can revert to pandas
-            incident_triggers = [
-                event
-                for trigger in workflow.workflow_triggers
-                if trigger["type"] == "incident"
-                for event in trigger.get("events", [])
-            ]
-
-            if trigger not in incident_triggers:
-                self.logger.debug(
-                    "workflow does not contain trigger %s, skipping", trigger
-                )
-                continue
-
-            incident_enrichment = get_enrichment(tenant_id, str(incident.id))
-            if incident_enrichment:
-                for k, v in incident_enrichment.enrichments.items():
-                    setattr(incident, k, v)
+            if not incident_enriched:
+                incident_enrichment = get_enrichment(tenant_id, str(incident.id))
+                if incident_enrichment:
+                    # bulk update, what setattr does for the extra fields
+                    # IncidentDto allows, without going through it per key
+                    incident.__dict__.update(incident_enrichment.enrichments)
+                    incident.__fields_set__.update(incident_enrichment.enrichments)
+                incident_enriched = True
 
             self.logger.info("Adding workflow to run")
-            with self.scheduler.lock:
-                self.scheduler.workflows_to_run.append(
-                    {
-                        "workflow": workflow,
-                        "workflow_id": workflow_model.id,
-                        "tenant_id": tenant_id,
-                        "triggered_by": "incident:{}".format(trigger),
-                        "event": incident,
-                    }
-                )
+            self.scheduler.workflows_to_run.put(
+                {
+                    "workflow": workflow,
+                    "workflow_id": workflow_model.id,
+                    "tenant_id": tenant_id,
+                    "triggered_by": "incident:{}".format(trigger),
+                    "event": incident,
+                }
+            )
             self.logger.info("Workflow added to run")
 
     def _get_event_value(self, event, filter_key):
-        # if the filter key is a nested key, get the value
-        if "." in filter_key:
-            filter_key_split = filter_key.split(".")
-            # event is alert dto so we need getattr
-            event_val = getattr(event, filter_key_split[0], None)
+        attr, keys = _parse_filter_key(filter_key)
+        # event is alert dto so we need getattr
+        event_val = getattr(event, attr, None)
+        # if the filter key is a nested key, iterate the other keys
+        for key in keys:
             if not event_val:
                 return None
-            # iterate the other keys
-            for key in filter_key_split[1:]:
-                event_val = event_val.get(key, None)
-                # if the key doesn't exist, return None because we didn't find the value
-                if not event_val:
-                    return None
-            return event_val
-        else:
-            return getattr(event, filter_key, None)
+            event_val = event_val.get(key, None)
+        # if a nested key doesn't exist, return None because we didn't find the value
+        if keys and not event_val:
+            return None
+        return event_val
 
     def _check_premium_providers(self, workflow: Workflow):
         """
@@ -301,15 +313,20 @@ class WorkflowManager:
         Raises:
             Exception: If the workflow uses premium providers in multi tenant mode.
         """
-        if os.environ.get("AUTH_TYPE", IdentityManagerTypes.NOAUTH.value) in (
-            IdentityManagerTypes.AUTH0.value,
-            "MULTI_TENANT",
-        ):  # backward compatibility
-            for provider in workflow.workflow_providers_type:
-                if provider in self.PREMIUM_PROVIDERS:
-                    raise Exception(
-                        f"Provider {provider} is a premium provider. You can self-host or contact us to get access to it."
-                    )
+        if not IS_MULTI_TENANT:
+            return
+        premium_provider = next(
+            (
+                provider
+                for provider in workflow.workflow_providers_type
+                if provider in self.PREMIUM_PROVIDERS
+            ),
+            None,
+        )
+        if premium_provider:
+            raise Exception(
+                f"Provider {premium_provider} is a premium provider. You can self-host or contact us to get access to it."
+            )
 
     def _run_workflow_on_failure(
         self, workflow: Workflow, workflow_execution_id: str, error_message: str
@@ -360,10 +377,12 @@ class WorkflowManager:
         self, workflow: Workflow, workflow_execution_id: str
     ):
         self.logger.debug(f"Running workflow {workflow.workflow_id}")
-        threading.current_thread().workflow_debug = workflow.workflow_debug
-        threading.current_thread().workflow_id = workflow.workflow_id
-        threading.current_thread().workflow_execution_id = workflow_execution_id
-        threading.current_thread().tenant_id = workflow.context_manager.tenant_id
+        # not reset after the run, like the thread attributes they replace, so the
+        # scheduler's logs about this execution are still in its context
+        workflow_debug_var.set(workflow.workflow_debug)
+        workflow_id_var.set(workflow.workflow_id)
+        workflow_execution_id_var.set(workflow_execution_id)
+        tenant_id_var.set(workflow.context_manager.tenant_id)
         errors = []
         try:
             self._check_premium_providers(workflow)
@@ -401,14 +420,8 @@ class WorkflowManager:
             dict: The results of the workflow.
         """
 
-        workflow_results = {
-            action.name: action.provider.results for action in workflow.workflow_actions
-        }
-        if workflow.workflow_steps:
-            workflow_results.update(
-                {step.name: step.provider.results for step in workflow.workflow_steps}
-            )
-        return workflow_results
+        # steps override actions with the same name
+        return dict(workflow.iter_named_results())
 
     def _save_workflow_results(self, workflow: Workflow, workflow_execution_id: str):
         """
@@ -419,15 +432,10 @@ class WorkflowManager:
             workflow_execution_id (str): The workflow execution ID.
         """
         self.logger.info(f"Saving workflow {workflow.workflow_id} results")
-        workflow_results = {
-            action.name: action.provider.results for action in workflow.workflow_actions
-        }
-        if workflow.workflow_steps:
-            workflow_results.update(
-                {step.name: step.provider.results for step in workflow.workflow_steps}
-            )
+        workflow_results = self._get_workflow_results(workflow)
         try:
-            save_workflow_results(
+            # batched with the results of concurrent executions
+            self.results_batcher.save(
                 tenant_id=workflow.context_manager.tenant_id,
                 workflow_execution_id=workflow_execution_id,
                 workflow_results=workflow_results,
@@ -440,20 +448,35 @@ class WorkflowManager:
             raise
         self.logger.info(f"Workflow {workflow.workflow_id} results saved")
 
-    def _run_workflows_from_cli(self, workflows: typing.List[Workflow]):
-        workflows_errors = []
-        for workflow in workflows:
-            try:
-                random_workflow_id = str(uuid.uuid4())
-                errors, _ = self._run_workflow(
-                    workflow, workflow_execution_id=random_workflow_id
+    async def _arun_workflow(self, workflow: Workflow, workflow_execution_id: str):
+        # the workflow run is blocking, run it in the default executor
+        return await asyncio.to_thread(
+            self._run_workflow, workflow, workflow_execution_id
+        )
+
+    async def _arun_workflows_from_cli(self, workflows: typing.List[Workflow]):
+        # the workflows are independent, so they run concurrently
+        workflow_execution_ids = _generate_workflow_execution_ids(len(workflows))
+        results = await asyncio.gather(
+            *[
+                self._arun_workflow(workflow, workflow_execution_id)
+                for workflow, workflow_execution_id in zip(
+                    workflows, workflow_execution_ids
                 )
-                workflows_errors.append(errors)
-            except Exception as e:
+            ],
+            return_exceptions=True,
+        )
+        workflows_errors = []
+        for workflow, result in zip(workflows, results):
+            if isinstance(result, Exception):
                 self.logger.error(
                     f"Error running workflow {workflow.workflow_id}",
-                    extra={"exception": e},
+                    extra={"exception": result},
                 )
-                raise
-
+                raise result
+            errors, _ = result
+            workflows_errors.append(errors)
         return workflows_errors
+
+    def _run_workflows_from_cli(self, workflows: typing.List[Workflow]):
+        return asyncio.run(self._arun_workflows_from_cli(workflows))
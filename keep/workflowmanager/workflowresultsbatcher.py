@@ -0,0 +1,119 @@
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+
+from sqlalchemy.exc import NoResultFound
+
+from keep.api.core.config import config
+from keep.api.core.db import save_workflows_results
+
+WORKFLOW_RESULTS_BATCH_SIZE = config(
+    "KEEP_WORKFLOW_RESULTS_BATCH_SIZE", cast=int, default=100
+)
+WORKFLOW_RESULTS_QUEUE_SIZE = config(
+    "KEEP_WORKFLOW_RESULTS_QUEUE_SIZE", cast=int, default=1000
+)
+
+
+class WorkflowResultsBatcher:
+    """
+    Group commit of workflow execution results.
+
+    Executions enqueue their results and wait for them to be saved. A flusher thread
+    saves everything queued meanwhile, up to batch_size, in one transaction, so
+    concurrent executions share a DB roundtrip while each execution's results are
+    still saved before it's marked as finished.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = WORKFLOW_RESULTS_BATCH_SIZE,
+        max_queue_size: int = WORKFLOW_RESULTS_QUEUE_SIZE,
+        poll_interval: float = 0.5,
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.queue: queue.Queue[tuple[str, str, dict, Future]] = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop_event: threading.Event | None = None
+
+    def save(self, tenant_id: str, workflow_execution_id: str, workflow_results: dict):
+        """
+        Save the results of a workflow execution, blocks until they are saved.
+
+        Raises:
+            NoResultFound: If the workflow execution doesn't exist.
+        """
+        future = Future()
+        with self._lock:
+            # started lazily, workflows can run without the manager being started (CLI)
+            if self._thread is None:
+                self._stop_event = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self._stop_event,),
+                    name="WorkflowResultsBatcher",
+                    daemon=True,
+                )
+                self._thread.start()
+            self.queue.put((tenant_id, workflow_execution_id, workflow_results, future))
+        future.result()
+
+    def stop(self):
+        """Save the queued results and stop the flusher thread."""
+        with self._lock:
+            if self._thread is None:
+                return
+            thread = self._thread
+            self._stop_event.set()
+        thread.join()
+
+    def _run(self, stop_event: threading.Event):
+        while True:
+            try:
+                batch = [self.queue.get(timeout=self.poll_interval)]
+            except queue.Empty:
+                with self._lock:
+                    # checked under the lock so nothing is queued after we exit
+                    if stop_event.is_set() and self.queue.empty():
+                        self._thread = None
+                        return
+                continue
+            # take whatever was queued meanwhile, no waiting for more
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch: list[tuple[str, str, dict, Future]]):
+        self.logger.debug(
+            "Saving workflows results", extra={"num_of_results": len(batch)}
+        )
+        try:
+            saved = save_workflows_results(
+                [
+                    (tenant_id, workflow_execution_id, workflow_results)
+                    for tenant_id, workflow_execution_id, workflow_results, _ in batch
+                ]
+            )
+        except Exception as e:
+            for *_, future in batch:
+                future.set_exception(e)
+            return
+
+        for _, workflow_execution_id, _, future in batch:
+            if workflow_execution_id in saved:
+                future.set_result(None)
+            else:
+                future.set_exception(
+                    NoResultFound(
+                        f"Workflow execution {workflow_execution_id} not found"
+                    )
+                )
@@ -1,11 +1,13 @@
 import enum
 import hashlib
 import logging
+import math
+import queue
+import threading
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
-from threading import Lock
 
 from sqlalchemy.exc import IntegrityError
 
@@ -72,18 +74,58 @@ def timing_histogram(histogram):
     return decorator
 
 
+class ThroughputManager:
+    """
+    Rolling events per second over the last `window` seconds.
+
+    Events are counted in a ring buffer of per-second buckets, a bucket is reset
+    when its slot is reused for a new second.
+    """
+
+    def __init__(self, window: int = 60):
+        self.window = window
+        self._counts = [0] * window
+        self._seconds = [0] * window
+        self._lock = threading.Lock()
+
+    def record(self, count: int = 1, now: float | None = None):
+        second = int(time.time() if now is None else now)
+        index = second % self.window
+        with self._lock:
+            if self._seconds[index] != second:
+                self._seconds[index] = second
+                self._counts[index] = 0
+            self._counts[index] += count
+
+    def average(self, now: float | None = None) -> float:
+        second = int(time.time() if now is None else now)
+        with self._lock:
+            total = sum(
+                count
+                for count, bucket_second in zip(self._counts, self._seconds)
+                if second - bucket_second < self.window
+            )
+        return total / self.window
+
+
 class WorkflowScheduler:
     MAX_SIZE_SIGNED_INT = 2147483647
     MAX_WORKERS = config("KEEP_MAX_WORKFLOW_WORKERS", default="20", cast=int)
+    # scale the number of concurrently running event workflows with their throughput
+    AUTOSCALE_WORKERS = (
+        config("KEEP_WORKFLOW_WORKERS_AUTOSCALE", default="false") == "true"
+    )
+    MIN_WORKERS = config("KEEP_MIN_WORKFLOW_WORKERS", default="2", cast=int)
+    AUTOSCALE_EVERY = 5  # scheduler iterations, roughly seconds
 
     def __init__(self, workflow_manager):
         self.logger = logging.getLogger(__name__)
         self.workflow_manager = workflow_manager
         self.workflow_store = WorkflowStore()
-        # all workflows that needs to be run due to alert event
-        self.workflows_to_run = []
+        # all workflows that needs to be run due to alert event,
+        # producers put() without taking a Python-level lock
+        self.workflows_to_run: queue.SimpleQueue[dict] = queue.SimpleQueue()
         self._stop = False
-        self.lock = Lock()
         self.interval_enabled = (
             config("WORKFLOWS_INTERVAL_ENABLED", default="true") == "true"
         )
@@ -93,17 +135,59 @@ class WorkflowScheduler:
         )
         self.scheduler_future = None
         self.futures = set()
-        # Initialize metrics for queue size
-        self._update_queue_metrics()
+        self.throughput = ThroughputManager()
+        # event workflows submitted at once, the executor has one more worker for
+        # the scheduler loop itself
+        self.max_concurrency = (
+            self.MIN_WORKERS if self.AUTOSCALE_WORKERS else self.MAX_WORKERS
+        )
 
-    def _update_queue_metrics(self):
+    def _update_queue_metrics(self, tenant_id: str):
         """Update queue size metrics"""
-        with self.lock:
-            for workflow in self.workflows_to_run:
-                tenant_id = workflow.get("tenant_id", "unknown")
-                workflow_queue_size.labels(tenant_id=tenant_id).set(
-                    len(self.workflows_to_run)
-                )
+        workflow_queue_size.labels(tenant_id=tenant_id).set(
+            self.workflows_to_run.qsize()
+        )
+
+    def _autoscale_workers(self):
+        """
+        Scale the event workflows concurrency with the rolling throughput.
+
+        It scales up to the throughput as soon as it's higher, and down one step at
+        a time once it's lower by more than one.
+        """
+        throughput = self.throughput.average()
+        if throughput > self.max_concurrency:
+            max_concurrency = math.ceil(throughput)
+        elif throughput < self.max_concurrency - 1:
+            max_concurrency = self.max_concurrency - 1
+        else:
+            return
+        max_concurrency = max(self.MIN_WORKERS, min(self.MAX_WORKERS, max_concurrency))
+        if max_concurrency != self.max_concurrency:
+            self.logger.info(
+                "Scaling event workflows concurrency",
+                extra={
+                    "throughput": throughput,
+                    "from": self.max_concurrency,
+                    "to": max_concurrency,
+                },
+            )
+            self.max_concurrency = max_concurrency
+
+    def _pop_workflows_to_run(self) -> list[dict]:
+        """
+        Take out the workflows queued so far.
+
+        Only the queued items are taken, so workflows re-queued while handling
+        them (e.g. retries) wait for the next round.
+        """
+        workflows_to_run = []
+        for _ in range(self.workflows_to_run.qsize()):
+            try:
+                workflows_to_run.append(self.workflows_to_run.get_nowait())
+            except queue.Empty:
+                break
+        return workflows_to_run
 
     async def start(self):
         self.logger.info("Starting workflows scheduler")
@@ -251,7 +335,7 @@ class WorkflowScheduler:
         finally:
             # Decrement running workflows counter
             workflows_running.labels(tenant_id=tenant_id).dec()
-            self._update_queue_metrics()
+            self._update_queue_metrics(tenant_id)
 
         if errors is not None and any(errors):
             self.logger.info(msg=f"Workflow {workflow.workflow_id} ran with errors")
@@ -317,21 +401,20 @@ class WorkflowScheduler:
                 "triggered_by_user": triggered_by_user,
             },
         )
-        with self.lock:
-            event.trigger = "manual"
-            self.workflows_to_run.append(
-                {
-                    "workflow_id": workflow_id,
-                    "workflow": workflow,
-                    "workflow_execution_id": workflow_execution_id,
-                    "tenant_id": tenant_id,
-                    "triggered_by": "manual",
-                    "triggered_by_user": triggered_by_user,
-                    "event": event,
-                    "retry": True,
-                    "test_run": test_run,
-                }
-            )
+        event.trigger = "manual"
+        self.workflows_to_run.put(
+            {
+                "workflow_id": workflow_id,
+                "workflow": workflow,
+                "workflow_execution_id": workflow_execution_id,
+                "tenant_id": tenant_id,
+                "triggered_by": "manual",
+                "triggered_by_user": triggered_by_user,
+                "event": event,
+                "retry": True,
+                "test_run": test_run,
+            }
+        )
         return workflow_execution_id
 
     def _get_unique_execution_number(self, fingerprint=None, workflow_id=None):
@@ -390,9 +473,19 @@ class WorkflowScheduler:
     def _handle_event_workflows(self):
         # TODO - event workflows should be in DB too, to avoid any state problems.
 
-        # take out all items from the workflows to run and run them, also, clean the self.workflows_to_run list
-        with self.lock:
-            workflows_to_run, self.workflows_to_run = self.workflows_to_run, []
+        # take out all items from the workflows to run and run them
+        workflows_to_run = self._pop_workflows_to_run()
+        # deferred workflows were already counted when they came in
+        self.throughput.record(
+            sum(1 for w in workflows_to_run if not w.get("deferred"))
+        )
+        if self.AUTOSCALE_WORKERS:
+            # the workflows above the concurrency wait for the next round
+            available = max(self.max_concurrency - len(self.futures), 0)
+            for workflow_to_run in workflows_to_run[available:]:
+                workflow_to_run["deferred"] = True
+                self.workflows_to_run.put(workflow_to_run)
+            workflows_to_run = workflows_to_run[:available]
         for workflow_to_run in workflows_to_run:
             self.logger.info(
                 "Running event workflow on background",
@@ -408,9 +501,7 @@ class WorkflowScheduler:
             workflow_id = workflow_to_run.get("workflow_id")
             tenant_id = workflow_to_run.get("tenant_id")
             # Update queue size metrics
-            workflow_queue_size.labels(tenant_id=tenant_id).set(
-                len(self.workflows_to_run)
-            )
+            self._update_queue_metrics(tenant_id)
             workflow_execution_id = workflow_to_run.get("workflow_execution_id")
             if not workflow:
                 self.logger.info("Loading workflow")
@@ -513,17 +604,16 @@ class WorkflowScheduler:
                                 "tenant_id": tenant_id,
                             },
                         )
-                        with self.lock:
-                            self.workflows_to_run.append(
-                                {
-                                    "workflow_id": workflow_id,
-                                    "workflow_execution_id": workflow_execution_id,
-                                    "tenant_id": tenant_id,
-                                    "triggered_by": triggered_by,
-                                    "event": event,
-                                    "retry": True,
-                                }
-                            )
+                        self.workflows_to_run.put(
+                            {
+                                "workflow_id": workflow_id,
+                                "workflow_execution_id": workflow_execution_id,
+                                "tenant_id": tenant_id,
+                                "triggered_by": triggered_by,
+                                "event": event,
+                                "retry": True,
+                            }
+                        )
                         continue
                     # else if NONPARALLEL, just finish the execution
                     elif (
@@ -639,6 +729,8 @@ class WorkflowScheduler:
                 self._handle_event_workflows()
                 if runs % RUN_TIMEOUT_CHECKS_EVERY == 0:
                     self._timeout_workflows()
+                if self.AUTOSCALE_WORKERS and runs % self.AUTOSCALE_EVERY == 0:
+                    self._autoscale_workers()
             except Exception:
                 # This is the "mainloop" of the scheduler, we don't want to crash it
                 # But any exception here should be investigated
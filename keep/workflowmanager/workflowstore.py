@@ -1,9 +1,16 @@
+import functools
 import io
 import logging
+import operator
 import os
 import random
-from typing import Tuple
+import re
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Tuple
 
 import requests
 import validators
@@ -19,8 +26,10 @@ from keep.api.core.db import (
     get_raw_workflow,
     get_workflow,
     get_workflow_execution,
+    get_workflows_version,
     get_workflows_with_last_execution,
 )
+from keep.api.core.config import config
 from keep.api.core.workflows import get_workflows_with_last_executions_v2
 from keep.api.models.db.workflow import Workflow as WorkflowModel
 from keep.api.models.workflow import ProviderDTO
@@ -30,7 +39,100 @@ from keep.providers.providers_factory import ProvidersFactory
 from keep.workflowmanager.workflow import Workflow
 
 
+logger = logging.getLogger(__name__)
+
+# a r"..." filter without any of these matches like a plain substring check
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]|()\\")
+
+WORKFLOWS_CACHE_MAX_TENANTS = config(
+    "KEEP_WORKFLOWS_CACHE_MAX_TENANTS", cast=int, default=1024
+)
+TRIGGERS_INDEX_MAX_WORKFLOWS = config(
+    "KEEP_TRIGGERS_INDEX_MAX_WORKFLOWS", cast=int, default=10000
+)
+# upper bound on how long a cached entry is trusted, for writes that bypass the version
+WORKFLOWS_CACHE_TTL = config("KEEP_WORKFLOWS_CACHE_TTL", cast=int, default=60)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_filter_regex(filter_val: str) -> re.Pattern | None:
+    """Compile a r"..." filter value once, None if it isn't a valid regex."""
+    try:
+        # remove the r" and the last "
+        return re.compile(filter_val[2:-1])
+    except re.error:
+        return None
+
+
+def _apply_regex_filter(pattern: re.Pattern | None, value, filter_val=None) -> bool:
+    """Whether a compiled regex filter matches the value, a None pattern never does."""
+    try:
+        if pattern is None:
+            raise ValueError(f"Invalid regex filter: {filter_val}")
+        return bool(pattern.findall(value))
+    except Exception as e:
+        logger.error(
+            f"Error applying regex filter: {filter_val} on value: {value}",
+            extra={"exception": e},
+        )
+        return False
+
+
+def _apply_literal_filter(literal: str, value, filter_val=None) -> bool:
+    """Same as a regex filter without metacharacters, as a substring check."""
+    if isinstance(value, str):
+        return literal in value
+    # non string values fail (and are logged) like they do with the regex
+    return _apply_regex_filter(_compile_filter_regex(filter_val), value, filter_val)
+
+
+def _apply_equality_filter(filter_val, value) -> bool:
+    # For cases like `dismissed`
+    if isinstance(filter_val, bool) and isinstance(value, str):
+        return value == str(filter_val)
+    return value == filter_val
+
+
+@dataclass(slots=True, frozen=True)
+class TriggerFilter:
+    key: str
+    value: Any
+    exclude: bool
+    # the value check, classified (regex, literal, equality) and compiled once
+    value_matches: Callable[[object], bool]
+
+    def matches(self, data: dict) -> bool:
+        # the include/exclude decision, a key missing from the data never matches
+        return self.key in data and self.value_matches(data[self.key]) != self.exclude
+
+
+@dataclass(slots=True, frozen=True)
+class Trigger:
+    """A workflow trigger, normalized once when the workflow is indexed."""
+
+    type: str
+    events: tuple[str, ...] = ()
+    filters: tuple[TriggerFilter, ...] = ()
+    group_mentions: bool = False
+
+    def matches(self, data: dict) -> bool:
+        # a trigger matches if all its filters do
+        return all(trigger_filter.matches(data) for trigger_filter in self.filters)
+
+
 class WorkflowStore:
+    # workflow id -> (workflow_raw, triggers by type), shared by all the stores so
+    # each workflow revision is indexed once, least recently used evicted first
+    _triggers_index: OrderedDict[str, tuple[str, dict[str, list[Trigger]]]] = (
+        OrderedDict()
+    )
+    _triggers_index_lock = threading.Lock()
+    # tenant id -> (workflows version, expires at, workflows), for dispatching events
+    _workflows_cache: OrderedDict[str, tuple[tuple, float, list[WorkflowModel]]] = (
+        OrderedDict()
+    )
+    _workflows_cache_lock = threading.Lock()
+
     def __init__(self):
         self.parser = Parser()
         self.logger = logging.getLogger(__name__)
@@ -59,6 +161,7 @@ class WorkflowStore:
             is_disabled=Parser.parse_disabled(workflow),
             workflow_raw=cyaml.dump(workflow, width=99999),
         )
+        self._invalidate_workflows_cache(tenant_id)
         self.logger.info(f"Workflow {workflow_id} created successfully")
         return workflow
 
@@ -73,12 +176,19 @@ class WorkflowStore:
             raise HTTPException(403, detail="Cannot delete a provisioned workflow")
         try:
             delete_workflow(tenant_id, workflow_id)
+            with self._triggers_index_lock:
+                self._triggers_index.pop(workflow_id, None)
+            self._invalidate_workflows_cache(tenant_id)
         except Exception as e:
             self.logger.exception(f"Error deleting workflow {workflow_id}: {str(e)}")
             raise HTTPException(
                 status_code=500, detail=f"Failed to delete workflow {workflow_id}"
             )
 
+    def _invalidate_workflows_cache(self, tenant_id: str):
+        with self._workflows_cache_lock:
+            self._workflows_cache.pop(tenant_id, None)
+
     def _parse_workflow_to_dict(self, workflow_path: str) -> dict:
         """
         Parse a workflow to a dictionary from either a file or a URL.
@@ -140,11 +250,139 @@ class WorkflowStore:
                 detail="Unable to parse workflow from dict",
             )
 
-    def get_all_workflows(self, tenant_id: str) -> list[WorkflowModel]:
-        # list all tenant's workflows
-        workflows = get_all_workflows(tenant_id)
+    def get_all_workflows(
+        self, tenant_id: str, include_disabled: bool = False
+    ) -> list[WorkflowModel]:
+        # list all tenant's workflows, the disabled ones are filtered in the DB
+        workflows = get_all_workflows(tenant_id, include_disabled=include_disabled)
+        return workflows
+
+    def get_workflows_by_trigger_type(
+        self, tenant_id: str, trigger_type: str
+    ) -> list[tuple[WorkflowModel, list[Trigger]]]:
+        """
+        Get the tenant's enabled workflows that have a trigger of the given type.
+
+        Args:
+            tenant_id (str): The tenant ID.
+            trigger_type (str): The trigger type, e.g. "incident".
+
+        Returns:
+            list[tuple[WorkflowModel, list[Trigger]]]: The workflows and their triggers of that type.
+        """
+        workflows = []
+        for workflow_model in self._get_cached_workflows(tenant_id):
+            triggers = self._get_triggers_by_type(workflow_model).get(trigger_type)
+            if triggers:
+                workflows.append((workflow_model, triggers))
+        return workflows
+
+    def _get_cached_workflows(self, tenant_id: str) -> list[WorkflowModel]:
+        """
+        Get the tenant's enabled workflows, reloaded when their version changed or
+        the entry is older than WORKFLOWS_CACHE_TTL.
+
+        The version is a single aggregated row, so hot tenants don't load all their
+        workflows on every event.
+        """
+        version = get_workflows_version(tenant_id)
+        now = time.monotonic()
+        with self._workflows_cache_lock:
+            cached = self._workflows_cache.get(tenant_id)
+            if cached and cached[0] == version and cached[1] > now:
+                self._workflows_cache.move_to_end(tenant_id)
+                return cached[2]
+
+        workflows = self.get_all_workflows(tenant_id, include_disabled=False)
+        with self._workflows_cache_lock:
+            self._workflows_cache[tenant_id] = (
+                version,
+                now + WORKFLOWS_CACHE_TTL,
+                workflows,
+            )
+            self._workflows_cache.move_to_end(tenant_id)
+            while len(self._workflows_cache) > WORKFLOWS_CACHE_MAX_TENANTS:
+                self._workflows_cache.popitem(last=False)
         return workflows
 
+    def _get_triggers_by_type(
+        self, workflow_model: WorkflowModel
+    ) -> dict[str, list[Trigger]]:
+        # the index entry is valid as long as the workflow yaml didn't change
+        with self._triggers_index_lock:
+            indexed = self._triggers_index.get(workflow_model.id)
+            if indexed and indexed[0] == workflow_model.workflow_raw:
+                self._triggers_index.move_to_end(workflow_model.id)
+                return indexed[1]
+
+        triggers_by_type = {}
+        try:
+            workflow_yaml = cyaml.safe_load(workflow_model.workflow_raw) or {}
+            # unwrap the yaml the same way Parser.parse does
+            raw_workflows = workflow_yaml.get("workflows") or workflow_yaml.get(
+                "alerts"
+            )
+            if not raw_workflows:
+                raw_workflows = [
+                    workflow_yaml.get("workflow")
+                    or workflow_yaml.get("alert")
+                    or workflow_yaml
+                ]
+            for raw_workflow in raw_workflows:
+                triggers = self.parser.get_triggers_from_workflow(raw_workflow) or []
+                for trigger in triggers:
+                    triggers_by_type.setdefault(trigger.get("type"), []).append(
+                        self._normalize_trigger(trigger)
+                    )
+        except Exception:
+            self.logger.exception(
+                "Failed to read the workflow triggers",
+                extra={"workflow_id": workflow_model.id},
+            )
+        with self._triggers_index_lock:
+            self._triggers_index[workflow_model.id] = (
+                workflow_model.workflow_raw,
+                triggers_by_type,
+            )
+            self._triggers_index.move_to_end(workflow_model.id)
+            while len(self._triggers_index) > TRIGGERS_INDEX_MAX_WORKFLOWS:
+                self._triggers_index.popitem(last=False)
+        return triggers_by_type
+
+    def _normalize_trigger(self, trigger: dict) -> Trigger:
+        return Trigger(
+            type=trigger.get("type"),
+            events=tuple(trigger.get("events") or []),
+            filters=tuple(
+                TriggerFilter(
+                    key=trigger_filter.get("key"),
+                    value=trigger_filter.get("value"),
+                    exclude=bool(trigger_filter.get("exclude", False)),
+                    value_matches=self._compile_filter(trigger_filter.get("value")),
+                )
+                for trigger_filter in trigger.get("filters") or []
+            ),
+            group_mentions=bool(trigger.get("group_mentions")),
+        )
+
+    def _compile_filter(self, filter_val) -> Callable[[object], bool]:
+        # the filter type is fixed per trigger, so dispatch once here
+        if isinstance(filter_val, str) and filter_val.startswith('r"'):
+            # remove the r" and the last "
+            literal = filter_val[2:-1]
+            if not REGEX_METACHARACTERS.intersection(literal):
+                return functools.partial(
+                    _apply_literal_filter, literal, filter_val=filter_val
+                )
+            return functools.partial(
+                _apply_regex_filter,
+                _compile_filter_regex(filter_val),
+                filter_val=filter_val,
+            )
+        if isinstance(filter_val, bool):
+            return functools.partial(_apply_equality_filter, filter_val)
+        return functools.partial(operator.eq, filter_val)
+
     def get_all_workflows_with_last_execution(
         self,
         tenant_id: str,
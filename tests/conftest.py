@@ -44,6 +44,10 @@ class PusherMock:
     def trigger(self, channel, event_name, data):
         self.triggers.append((channel, event_name, data))
 
+    def trigger_batch(self, batch):
+        for event in batch:
+            self.trigger(event["channel"], event["name"], event["data"])
+
 
 class WorkflowManagerMock:
 
@@ -322,7 +326,8 @@ actions:
     with patch("keep.api.core.db.engine", mock_engine):
         with patch("keep.api.core.db_utils.create_db_engine", return_value=mock_engine):
             with patch("keep.api.core.alerts.engine", mock_engine):
-                yield session
+                with patch("keep.api.core.incidents.engine", mock_engine):
+                    yield session
 
     import logging
 
@@ -118,6 +118,72 @@ def test_bearer_token(db_session, client, test_app):
         assert response.status_code == 401 if auth_type != "NO_AUTH" else 200
 
 
+@pytest.mark.parametrize("test_app", ["SINGLE_TENANT"], indirect=True)
+def test_bearer_token_verification_is_cached(db_session, client, test_app):
+    """Tests that a verified bearer token isn't verified again on the next request"""
+    from keep.api.core import dependencies
+    from keep.identitymanager import authverifierbase
+
+    def verified_decodes():
+        # the logging middleware decodes every token without verifying it
+        return [
+            call
+            for call in jwt_decode.call_args_list
+            if call.kwargs.get("options", {}).get("verify_signature", True)
+        ]
+
+    authverifierbase._verified_tokens.clear()
+    dependencies.jwks_client = MockJWKClient()
+    with patch("jwt.decode", side_effect=get_mock_jwt_payload) as jwt_decode, patch(
+        "jwt.PyJWKClient.get_signing_key_from_jwt",
+        side_effect=mock_get_signing_key_from_jwt,
+    ):
+        for _ in range(3):
+            response = client.get(
+                "/providers", headers={"Authorization": f"Bearer {MOCK_TOKEN}"}
+            )
+            assert response.status_code == 200
+        assert len(verified_decodes()) == 1
+
+        # invalid tokens are never cached
+        for _ in range(2):
+            response = client.get(
+                "/providers", headers={"Authorization": "Bearer invalid_token"}
+            )
+            assert response.status_code == 401
+        assert len(verified_decodes()) == 3
+
+
+def test_bearer_token_cache_respects_token_expiry():
+    """Tests that a verified bearer token isn't cached past its exp claim"""
+    import time
+
+    import jwt
+
+    from keep.identitymanager import authverifierbase
+    from keep.identitymanager.authenticatedentity import AuthenticatedEntity
+    from keep.identitymanager.authverifierbase import AuthVerifierBase
+
+    entity = AuthenticatedEntity(
+        tenant_id=SINGLE_TENANT_UUID, email="admin@keephq.dev", role="admin"
+    )
+    authverifierbase._verified_tokens.clear()
+
+    expiring_token = jwt.encode({"exp": int(time.time()) + 5}, "secret")
+    AuthVerifierBase._cache_entity("expiring", entity, expiring_token)
+    expires_at, _ = authverifierbase._verified_tokens["expiring"]
+    assert expires_at <= time.monotonic() + 5
+
+    expired_token = jwt.encode({"exp": int(time.time()) - 1}, "secret")
+    AuthVerifierBase._cache_entity("expired", entity, expired_token)
+    assert "expired" not in authverifierbase._verified_tokens
+
+    # tokens without an exp claim get the configured TTL
+    AuthVerifierBase._cache_entity("no-exp", entity, jwt.encode({}, "secret"))
+    expires_at, _ = authverifierbase._verified_tokens["no-exp"]
+    assert expires_at > time.monotonic() + 5
+
+
 @pytest.mark.parametrize(
     "test_app", ["SINGLE_TENANT", "MULTI_TENANT", "NO_AUTH"], indirect=True
 )
@@ -1,17 +1,18 @@
 from datetime import UTC, datetime, timedelta
 from itertools import cycle
 from unittest.mock import patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 from fastapi import HTTPException
-from sqlalchemy import and_, desc, distinct, func
+from sqlalchemy import and_, desc, distinct, func, inspect
 
 from keep.api.bl.incidents_bl import IncidentBl
 from keep.api.core.db import (
     IncidentSorting,
     add_alerts_to_incident_by_incident_id,
     create_incident_from_dict,
+    enrich_entity,
     get_alert_by_event_id,
     get_alerts_data_for_incident,
     get_incident_alerts_by_incident_id,
@@ -22,6 +23,8 @@ from keep.api.core.db import (
 )
 from keep.api.core.db_utils import get_json_extract_field
 from keep.api.core.dependencies import SINGLE_TENANT_EMAIL, SINGLE_TENANT_UUID
+from keep.api.core.incidents import get_last_incidents_by_cel
+from keep.api.models.action_type import ActionType
 from keep.api.models.alert import AlertSeverity, AlertStatus
 from keep.api.models.db.alert import (
     NULL_FOR_DELETED_AT,
@@ -29,6 +32,7 @@ from keep.api.models.db.alert import (
     Incident,
     LastAlertToIncident,
 )
+from keep.api.models.db.comment_mention import CommentMention
 from keep.api.models.db.incident import IncidentSeverity, IncidentStatus
 from keep.api.models.db.mapping import MappingRule
 from keep.api.models.db.rule import CreateIncidentOn, ResolveOn, Rule
@@ -583,6 +587,246 @@ def test_incident_metadata(
     assert data["sources"] == ["keep", "keep-test", "keep-test-2"]
 
 
+class RedisCacheMock:
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value.encode() if isinstance(value, str) else value
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, b"0")) + 1).encode()
+
+
+@pytest.mark.parametrize("test_app", ["NO_AUTH"], indirect=True)
+def test_get_incidents_cached(db_session, client, test_app):
+    create_incident_from_dict(
+        SINGLE_TENANT_UUID,
+        {"user_generated_name": "test-1", "user_summary": "test-1"},
+    )
+
+    def count_incidents():
+        response = client.get("/incidents", headers={"x-api-key": "some-key"})
+        assert response.status_code == 200
+        return response.json()["count"]
+
+    with patch(
+        "keep.api.core.cache.get_redis_client", return_value=RedisCacheMock()
+    ):
+        assert count_incidents() == 1
+
+        # Served from the cache, the new incident is not there yet
+        create_incident_from_dict(
+            SINGLE_TENANT_UUID,
+            {"user_generated_name": "test-2", "user_summary": "test-2"},
+        )
+        assert count_incidents() == 1
+
+        IncidentBl(SINGLE_TENANT_UUID, db_session).update_client_on_incident_change()
+        assert count_incidents() == 2
+
+
+@pytest.mark.parametrize("test_app", ["NO_AUTH"], indirect=True)
+def test_get_incidents_by_cursor(db_session, client, test_app):
+    for i in range(5):
+        create_incident_from_dict(
+            SINGLE_TENANT_UUID,
+            {"user_generated_name": f"test-{i}", "user_summary": f"test-{i}"},
+        )
+
+    pages = []
+    cursor = ""
+    while cursor is not None:
+        response = client.get(
+            "/incidents",
+            params={"limit": 2, "cursor": cursor},
+            headers={"x-api-key": "some-key"},
+        )
+        assert response.status_code == 200
+        result = response.json()
+        assert result["count"] == 5
+        pages.append([incident["user_generated_name"] for incident in result["items"]])
+        cursor = result["next_cursor"]
+
+    assert pages == [["test-4", "test-3"], ["test-2", "test-1"], ["test-0"]]
+
+    response = client.get(
+        "/incidents",
+        params={"cursor": "not-a-cursor"},
+        headers={"x-api-key": "some-key"},
+    )
+    assert response.status_code == 400
+
+    response = client.get(
+        "/incidents",
+        params={"cursor": "", "sorting": "severity"},
+        headers={"x-api-key": "some-key"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("test_app", ["NO_AUTH"], indirect=True)
+def test_get_incident_alerts_without_total(db_session, client, test_app, create_alert):
+    for fingerprint in ["fp1", "fp2"]:
+        create_alert(
+            fingerprint,
+            AlertStatus.FIRING,
+            datetime.utcnow(),
+            {"severity": AlertSeverity.CRITICAL.value},
+        )
+    incident = create_incident_from_dict(
+        SINGLE_TENANT_UUID, {"user_generated_name": "test", "user_summary": "test"}
+    )
+    add_alerts_to_incident_by_incident_id(SINGLE_TENANT_UUID, incident.id, ["fp1", "fp2"])
+
+    response = client.get(
+        f"/incidents/{incident.id}/alerts", headers={"x-api-key": "some-key"}
+    )
+    assert response.status_code == 200
+    assert response.json()["count"] == 2
+    assert len(response.json()["items"]) == 2
+
+    response = client.get(
+        f"/incidents/{incident.id}/alerts",
+        params={"with_total": False},
+        headers={"x-api-key": "some-key"},
+    )
+    assert response.status_code == 200
+    assert response.json()["count"] is None
+    assert len(response.json()["items"]) == 2
+
+    response = client.get(
+        "/incidents", params={"with_total": False}, headers={"x-api-key": "some-key"}
+    )
+    assert response.status_code == 200
+    assert response.json()["count"] is None
+    assert len(response.json()["items"]) == 1
+
+    response = client.get(
+        f"/incidents/{incident.id}/workflows",
+        params={"with_total": False},
+        headers={"x-api-key": "some-key"},
+    )
+    assert response.status_code == 200
+    assert response.json()["count"] is None
+    assert response.json()["items"] == []
+
+
+@pytest.mark.parametrize("test_app", ["NO_AUTH"], indirect=True)
+def test_get_incident_with_includes(db_session, client, test_app, create_alert):
+    for fingerprint in ["fp1", "fp2"]:
+        create_alert(
+            fingerprint,
+            AlertStatus.FIRING,
+            datetime.utcnow(),
+            {"severity": AlertSeverity.CRITICAL.value},
+        )
+    incident = create_incident_from_dict(
+        SINGLE_TENANT_UUID, {"user_generated_name": "test", "user_summary": "test"}
+    )
+    add_alerts_to_incident_by_incident_id(SINGLE_TENANT_UUID, incident.id, ["fp1", "fp2"])
+
+    # without include the response is unchanged
+    response = client.get(f"/incidents/{incident.id}", headers={"x-api-key": "some-key"})
+    assert response.status_code == 200
+    assert response.json()["id"] == str(incident.id)
+
+    response = client.get(
+        f"/incidents/{incident.id}",
+        params={"include": "alerts,workflows"},
+        headers={"x-api-key": "some-key"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["incident"]["id"] == str(incident.id)
+    assert data["alerts"]["count"] == 2
+    assert {alert["fingerprint"] for alert in data["alerts"]["items"]} == {"fp1", "fp2"}
+    assert data["workflows"]["count"] == 0
+    assert data["workflows"]["items"] == []
+
+    response = client.get(
+        f"/incidents/{incident.id}",
+        params={"include": "alerts", "limit": 1, "with_total": False},
+        headers={"x-api-key": "some-key"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["alerts"]["count"] is None
+    assert len(data["alerts"]["items"]) == 1
+    assert data["workflows"] is None
+
+    response = client.get(
+        f"/incidents/{incident.id}",
+        params={"include": "comments"},
+        headers={"x-api-key": "some-key"},
+    )
+    assert response.status_code == 400
+
+    # both response shapes are documented
+    schema = client.get("/openapi.json").json()["paths"]["/incidents/{incident_id}"]
+    response_schema = schema["get"]["responses"]["200"]["content"]["application/json"]
+    assert {ref["$ref"].rsplit("/", 1)[-1] for ref in response_schema["schema"]["anyOf"]} == {
+        "IncidentDto",
+        "IncidentWithRelationsDto",
+    }
+
+
+def test_get_last_incidents_with_alerts_loads_enrichments(db_session, create_alert):
+    for fingerprint in ["fp1", "fp2"]:
+        create_alert(
+            fingerprint,
+            AlertStatus.FIRING,
+            datetime.utcnow(),
+            {"severity": AlertSeverity.CRITICAL.value},
+        )
+        enrich_entity(
+            SINGLE_TENANT_UUID,
+            fingerprint,
+            {"note": fingerprint},
+            ActionType.GENERIC_ENRICH,
+            "test",
+            "test",
+        )
+    incident = create_incident_from_dict(
+        SINGLE_TENANT_UUID, {"user_generated_name": "test", "user_summary": "test"}
+    )
+    add_alerts_to_incident_by_incident_id(SINGLE_TENANT_UUID, incident.id, ["fp1", "fp2"])
+
+    incidents, _ = get_last_incidents_by_cel(SINGLE_TENANT_UUID, with_alerts=True)
+
+    alerts = incidents[0].alerts
+    assert len(alerts) == 2
+    for alert in alerts:
+        # Loaded together with the alerts, not lazily per alert
+        assert "alert_enrichment" not in inspect(alert).unloaded
+        assert alert.alert_enrichment.enrichments["note"] == alert.fingerprint
+
+
+def test_incident_dto_from_db_incident_fast(db_session):
+    incident = create_incident_from_dict(
+        SINGLE_TENANT_UUID,
+        {
+            "user_generated_name": "test",
+            "user_summary": "test",
+            "status": IncidentStatus.ACKNOWLEDGED.value,
+            "severity": IncidentSeverity.WARNING.order,
+        },
+    )
+
+    dto = IncidentDto.from_db_incident(incident)
+    fast_dto = IncidentDto.from_db_incident_fast(incident)
+
+    assert fast_dto == dto
+    assert fast_dto.json() == dto.json()
+    assert fast_dto.status == IncidentStatus.ACKNOWLEDGED
+    assert fast_dto.severity == IncidentSeverity.WARNING
+    assert fast_dto._tenant_id == SINGLE_TENANT_UUID
+
+
 def test_add_alerts_with_same_fingerprint_to_incident(db_session, create_alert):
     create_alert(
         "fp1",
@@ -1070,6 +1314,103 @@ def test_split_incident_app(db_session, client, test_app, create_alert):
     assert incident_2_after_via_api["alerts_count"] == 1
 
 
+@pytest.mark.parametrize("test_app", ["NO_AUTH"], indirect=True)
+def test_add_comment_with_mentions(db_session, client, test_app):
+    incident = create_incident_from_dict(
+        SINGLE_TENANT_UUID,
+        {"user_generated_name": "Commented incident", "user_summary": "test"},
+    )
+
+    response = client.post(
+        f"/incidents/{incident.id}/comment",
+        headers={"x-api-key": "some-key"},
+        json={
+            "status": IncidentStatus.FIRING.value,
+            "comment": "@alice please check with @bob.smith and @alice",
+        },
+    )
+    assert response.status_code == 200
+    comment_id = UUID(response.json()["id"])
+
+    mentions = (
+        db_session.query(CommentMention)
+        .filter(CommentMention.comment_id == comment_id)
+        .all()
+    )
+    assert sorted(m.user_id for m in mentions) == ["alice", "bob.smith"]
+    assert all(m.tenant_id == SINGLE_TENANT_UUID for m in mentions)
+    # Filled by the DB
+    assert all(m.created_at is not None for m in mentions)
+
+
+@pytest.mark.parametrize("test_app", ["NO_AUTH"], indirect=True)
+def test_add_comment_notifies_each_mention_once(db_session, client, test_app):
+    from keep.api.core.dependencies import get_pusher_client
+
+    incident = create_incident_from_dict(
+        SINGLE_TENANT_UUID,
+        {"user_generated_name": "Commented incident", "user_summary": "test"},
+    )
+    pusher = PusherMock()
+    test_app.dependency_overrides[get_pusher_client] = lambda: pusher
+
+    with patch("keep.api.routes.incidents.WorkflowManager") as workflow_manager:
+        response = client.post(
+            f"/incidents/{incident.id}/comment",
+            headers={"x-api-key": "some-key"},
+            json={
+                "status": IncidentStatus.FIRING.value,
+                "comment": "@alice @alice @bob",
+            },
+        )
+    test_app.dependency_overrides.pop(get_pusher_client)
+
+    assert response.status_code == 200
+    mentioned = [
+        data["mentioned_user"]
+        for _, event_name, data in pusher.triggers
+        if event_name == "user-mentioned"
+    ]
+    assert mentioned == ["alice", "bob"]
+    assert [event_name for _, event_name, _ in pusher.triggers].count(
+        "incident-comment"
+    ) == 1
+    insert_user_assigned_event_batch = (
+        workflow_manager.get_instance.return_value.insert_user_assigned_event_batch
+    )
+    insert_user_assigned_event_batch.assert_called_once()
+    assert insert_user_assigned_event_batch.call_args.kwargs["data"][
+        "mentioned_users"
+    ] == ["alice", "bob"]
+
+
+def test_notify_comment_pusher_failure_doesnt_block_workflows():
+    from keep.api.routes.incidents import _notify_comment
+
+    class FailingPusherMock(PusherMock):
+        def trigger_batch(self, batch):
+            raise TimeoutError("pusher timed out")
+
+    with patch("keep.api.routes.incidents.WorkflowManager") as workflow_manager:
+        _notify_comment(
+            FailingPusherMock(),
+            SINGLE_TENANT_UUID,
+            str(uuid4()),
+            str(uuid4()),
+            ["alice", "bob", "carol"],
+            "admin@keephq.dev",
+            "@alice @bob @carol",
+        )
+
+    insert_user_assigned_event_batch = (
+        workflow_manager.get_instance.return_value.insert_user_assigned_event_batch
+    )
+    insert_user_assigned_event_batch.assert_called_once()
+    assert insert_user_assigned_event_batch.call_args.kwargs["data"][
+        "mentioned_users"
+    ] == ["alice", "bob", "carol"]
+
+
 def test_cross_tenant_exposure_issue_2768(db_session, create_alert):
 
     tenant_data = [
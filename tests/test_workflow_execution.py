@@ -446,7 +446,7 @@ def test_workflow_execution_2(
 
     # Insert the current alert into the workflow manager
     workflow_manager.insert_events(SINGLE_TENANT_UUID, [current_alert])
-    assert len(workflow_manager.scheduler.workflows_to_run) == 1
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 1
 
     # Wait for the workflow execution to complete
     workflow_execution = None
@@ -466,7 +466,7 @@ def test_workflow_execution_2(
         time.sleep(1)
         count += 1
 
-    assert len(workflow_manager.scheduler.workflows_to_run) == 0
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 0
     # Check if the workflow execution was successful
     assert workflow_execution is not None
     assert workflow_execution.status == "success"
@@ -818,7 +818,7 @@ def test_workflow_incident_triggers(
         return workflow_execution
 
     workflow_manager.insert_incident(SINGLE_TENANT_UUID, incident, "created")
-    assert len(workflow_manager.scheduler.workflows_to_run) == 1
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 1
 
     workflow_execution_created = wait_workflow_execution(
         "incident-triggers-test-created-updated"
@@ -828,10 +828,10 @@ def test_workflow_incident_triggers(
     assert workflow_execution_created.results["mock-action"] == [
         '"incident: incident"\n'
     ]
-    assert len(workflow_manager.scheduler.workflows_to_run) == 0
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 0
 
     workflow_manager.insert_incident(SINGLE_TENANT_UUID, incident, "updated")
-    assert len(workflow_manager.scheduler.workflows_to_run) == 1
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 1
     workflow_execution_updated = wait_workflow_execution(
         "incident-triggers-test-created-updated"
     )
@@ -843,7 +843,7 @@ def test_workflow_incident_triggers(
 
     # incident-triggers-test-created-updated should not be triggered
     workflow_manager.insert_incident(SINGLE_TENANT_UUID, incident, "deleted")
-    assert len(workflow_manager.scheduler.workflows_to_run) == 0
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 0
 
     workflow_deleted = Workflow(
         id="incident-triggers-test-deleted",
@@ -858,13 +858,13 @@ def test_workflow_incident_triggers(
     db_session.commit()
 
     workflow_manager.insert_incident(SINGLE_TENANT_UUID, incident, "deleted")
-    assert len(workflow_manager.scheduler.workflows_to_run) == 1
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 1
 
     # incident-triggers-test-deleted should be triggered now
     workflow_execution_deleted = wait_workflow_execution(
         "incident-triggers-test-deleted"
     )
-    assert len(workflow_manager.scheduler.workflows_to_run) == 0
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 0
 
     assert workflow_execution_deleted is not None
     assert workflow_execution_deleted.status == "success"
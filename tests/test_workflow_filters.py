@@ -65,11 +65,11 @@ triggers:
     workflow_manager.insert_events(
         SINGLE_TENANT_UUID, [payments_alert, ftp_alert, other_alert]
     )
-    assert len(workflow_manager.scheduler.workflows_to_run) == 2
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 2
 
     # Validate specific alerts in workflows_to_run
     triggered_alerts = [
-        w.get("event") for w in workflow_manager.scheduler.workflows_to_run
+        w.get("event") for w in workflow_manager.scheduler._pop_workflows_to_run()
     ]
     assert any(a.id == "alert-1" and a.service == "payments" for a in triggered_alerts)
     assert any(a.id == "alert-2" and a.service == "ftp" for a in triggered_alerts)
@@ -131,11 +131,11 @@ triggers:
     workflow_manager.insert_events(
         SINGLE_TENANT_UUID, [grafana_alert, prometheus_alert, sentry_alert]
     )
-    assert len(workflow_manager.scheduler.workflows_to_run) == 2
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 2
 
     # Validate triggered alerts
     triggered_alerts = [
-        w.get("event") for w in workflow_manager.scheduler.workflows_to_run
+        w.get("event") for w in workflow_manager.scheduler._pop_workflows_to_run()
     ]
     assert any(
         a.id == "grafana-1" and a.source == ["grafana"] for a in triggered_alerts
@@ -198,10 +198,10 @@ triggers:
     )
 
     workflow_manager.insert_events(SINGLE_TENANT_UUID, [matching_alert, wrong_severity])
-    assert len(workflow_manager.scheduler.workflows_to_run) == 1
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 1
 
     # Validate the triggered alert
-    triggered_alert = workflow_manager.scheduler.workflows_to_run[0].get("event")
+    triggered_alert = workflow_manager.scheduler._pop_workflows_to_run()[0].get("event")
     assert triggered_alert.id == "sentry-1"
     assert triggered_alert.source == ["sentry"]
     assert triggered_alert.severity == "critical"
@@ -246,11 +246,11 @@ triggers:
     ]
 
     workflow_manager.insert_events(SINGLE_TENANT_UUID, alerts)
-    assert len(workflow_manager.scheduler.workflows_to_run) == 4
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 4
 
     # Validate all alerts are triggered
     triggered_alerts = [
-        w.get("event") for w in workflow_manager.scheduler.workflows_to_run
+        w.get("event") for w in workflow_manager.scheduler._pop_workflows_to_run()
     ]
     for i, source in enumerate(test_sources):
         assert any(
@@ -314,10 +314,10 @@ triggers:
     )
 
     workflow_manager.insert_events(SINGLE_TENANT_UUID, [matching_alert, excluded_alert])
-    assert len(workflow_manager.scheduler.workflows_to_run) == 1
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 1
 
     # Validate the triggered alert
-    triggered_alert = workflow_manager.scheduler.workflows_to_run[0].get("event")
+    triggered_alert = workflow_manager.scheduler._pop_workflows_to_run()[0].get("event")
     assert triggered_alert.id == "grafana-1"
     assert triggered_alert.source == ["grafana"]
     assert triggered_alert.service == "api"
@@ -395,10 +395,10 @@ triggers:
     workflow_manager.insert_events(
         SINGLE_TENANT_UUID, matching_alerts + non_matching_alerts
     )
-    assert len(workflow_manager.scheduler.workflows_to_run) == 2
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 2
 
     triggered_alerts = [
-        w.get("event") for w in workflow_manager.scheduler.workflows_to_run
+        w.get("event") for w in workflow_manager.scheduler._pop_workflows_to_run()
     ]
     assert any(
         a.id == "alert-1" and a.name == "error.database.critical"
@@ -470,9 +470,9 @@ triggers:
     workflow_manager.insert_events(
         SINGLE_TENANT_UUID, [matching_alert, wrong_time, wrong_severity]
     )
-    assert len(workflow_manager.scheduler.workflows_to_run) == 1
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 1
 
-    triggered_alert = workflow_manager.scheduler.workflows_to_run[0].get("event")
+    triggered_alert = workflow_manager.scheduler._pop_workflows_to_run()[0].get("event")
     assert triggered_alert.id == "alert-1"
     assert triggered_alert.severity == "critical"
     assert triggered_alert.lastReceived.startswith("2025-01-30T09:")
@@ -530,9 +530,9 @@ triggers:
     workflow_manager.insert_events(
         SINGLE_TENANT_UUID, [matching_alert, non_empty_service]
     )
-    assert len(workflow_manager.scheduler.workflows_to_run) == 1
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 1
 
-    triggered_alert = workflow_manager.scheduler.workflows_to_run[0].get("event")
+    triggered_alert = workflow_manager.scheduler._pop_workflows_to_run()[0].get("event")
     assert triggered_alert.id == "alert-1"
     assert triggered_alert.service == ""
     assert triggered_alert.severity == "critical"
@@ -608,10 +608,10 @@ triggers:
     workflow_manager.insert_events(
         SINGLE_TENANT_UUID, matching_alerts + non_matching_alerts
     )
-    assert len(workflow_manager.scheduler.workflows_to_run) == 2
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 2
 
     triggered_alerts = [
-        w.get("event") for w in workflow_manager.scheduler.workflows_to_run
+        w.get("event") for w in workflow_manager.scheduler._pop_workflows_to_run()
     ]
     assert any(
         a.id == "alert-1" and a.name == "error.database.critical"
@@ -683,9 +683,9 @@ triggers:
     workflow_manager.insert_events(
         SINGLE_TENANT_UUID, [matching_alert, wrong_time, wrong_severity]
     )
-    assert len(workflow_manager.scheduler.workflows_to_run) == 1
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 1
 
-    triggered_alert = workflow_manager.scheduler.workflows_to_run[0].get("event")
+    triggered_alert = workflow_manager.scheduler._pop_workflows_to_run()[0].get("event")
     assert triggered_alert.id == "alert-1"
     assert triggered_alert.severity == "critical"
     assert triggered_alert.lastReceived.startswith("2025-01-30T09:")
@@ -743,9 +743,9 @@ triggers:
     workflow_manager.insert_events(
         SINGLE_TENANT_UUID, [matching_alert, non_empty_service]
     )
-    assert len(workflow_manager.scheduler.workflows_to_run) == 1
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 1
 
-    triggered_alert = workflow_manager.scheduler.workflows_to_run[0].get("event")
+    triggered_alert = workflow_manager.scheduler._pop_workflows_to_run()[0].get("event")
     assert triggered_alert.id == "alert-1"
     assert triggered_alert.service == ""
     assert triggered_alert.severity == "critical"
@@ -819,9 +819,9 @@ triggers:
     workflow_manager.insert_events(
         SINGLE_TENANT_UUID, [matching_alert, excluded_severity, excluded_status]
     )
-    assert len(workflow_manager.scheduler.workflows_to_run) == 1
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 1
 
-    triggered_alert = workflow_manager.scheduler.workflows_to_run[0].get("event")
+    triggered_alert = workflow_manager.scheduler._pop_workflows_to_run()[0].get("event")
     assert triggered_alert.id == "alert-1"
     assert triggered_alert.service == "api"
     assert triggered_alert.severity == "info"
@@ -901,10 +901,10 @@ triggers:
     workflow_manager.insert_events(
         SINGLE_TENANT_UUID, matching_alerts + excluded_alerts
     )
-    assert len(workflow_manager.scheduler.workflows_to_run) == 2
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 2
 
     triggered_alerts = [
-        w.get("event") for w in workflow_manager.scheduler.workflows_to_run
+        w.get("event") for w in workflow_manager.scheduler._pop_workflows_to_run()
     ]
     assert any(a.id == "alert-1" and "database" not in a.name for a in triggered_alerts)
     assert any(a.id == "alert-2" and "database" not in a.name for a in triggered_alerts)
@@ -985,10 +985,76 @@ triggers:
     workflow_manager.insert_events(
         SINGLE_TENANT_UUID, matching_alerts + excluded_alerts
     )
-    assert len(workflow_manager.scheduler.workflows_to_run) == 2
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 2
 
     triggered_alerts = [
-        w.get("event") for w in workflow_manager.scheduler.workflows_to_run
+        w.get("event") for w in workflow_manager.scheduler._pop_workflows_to_run()
     ]
     assert any(a.id == "alert-1" and a.source == ["grafana"] for a in triggered_alerts)
     assert any(a.id == "alert-2" and a.source == ["custom"] for a in triggered_alerts)
+
+
+def test_user_assigned_event_batch(db_session):
+    """Test user_assigned workflows run per matching user, or once when grouped"""
+    workflow_manager = WorkflowManager()
+    per_user_definition = """workflow:
+id: per-user-mention
+triggers:
+- type: user_assigned
+  filters:
+  - key: mentioned_user
+    value: r"(alice|bob)"
+"""
+    grouped_definition = """workflow:
+id: grouped-mention
+triggers:
+- type: user_assigned
+  group_mentions: true
+  filters:
+  - key: mentioned_user
+    value: carol
+    exclude: true
+"""
+    for workflow_id, workflow_definition in [
+        ("per-user-mention", per_user_definition),
+        ("grouped-mention", grouped_definition),
+    ]:
+        db_session.add(
+            WorkflowDB(
+                id=workflow_id,
+                name=workflow_id,
+                tenant_id=SINGLE_TENANT_UUID,
+                description="Handle user mentions",
+                created_by="test@keephq.dev",
+                interval=0,
+                workflow_raw=workflow_definition,
+            )
+        )
+    db_session.commit()
+
+    data = {
+        "incident_id": "incident-1",
+        "comment_id": "comment-1",
+        "mentioned_by": "admin@keephq.dev",
+        "comment_text": "@alice @bob @carol",
+    }
+    workflow_manager.insert_user_assigned_event_batch(
+        SINGLE_TENANT_UUID, {**data, "mentioned_users": ["alice", "bob", "carol"]}
+    )
+
+    runs = workflow_manager.scheduler._pop_workflows_to_run()
+    per_user_runs = [w for w in runs if w["workflow_id"] == "per-user-mention"]
+    grouped_runs = [w for w in runs if w["workflow_id"] == "grouped-mention"]
+    assert [w["event"]["mentioned_user"] for w in per_user_runs] == ["alice", "bob"]
+    assert len(grouped_runs) == 1
+    assert grouped_runs[0]["event"]["mentioned_users"] == ["alice", "bob"]
+
+    # the single user API goes through the batch
+    workflow_manager.insert_user_assigned_event(
+        SINGLE_TENANT_UUID, {**data, "mentioned_user": "bob"}
+    )
+    runs = workflow_manager.scheduler._pop_workflows_to_run()
+    assert sorted(w["workflow_id"] for w in runs) == [
+        "grouped-mention",
+        "per-user-mention",
+    ]
@@ -1,17 +1,39 @@
+import contextvars
+import functools
+import logging
+import threading
+import time
+import uuid
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 from fastapi import HTTPException
-
+from sqlalchemy.exc import NoResultFound
+
+from keep.api.core.dependencies import SINGLE_TENANT_UUID
+from keep.api.logging import (
+    WorkflowContextFilter,
+    step_id_var,
+    tenant_id_var,
+    workflow_execution_id_var,
+    workflow_id_var,
+)
+from keep.api.models.db.workflow import WorkflowExecution
+from keep.api.models.incident import IncidentDto
 from keep.api.routes.workflows import get_event_from_body
 from keep.parser.parser import Parser
 
 # Assuming WorkflowParser is the class containing the get_workflow_from_dict method
 from keep.workflowmanager.workflow import Workflow
-from keep.workflowmanager.workflowmanager import WorkflowManager
-from keep.workflowmanager.workflowscheduler import WorkflowScheduler
-from keep.workflowmanager.workflowstore import WorkflowStore
+from keep.workflowmanager.workflowmanager import (
+    WorkflowManager,
+    _compile_filter_regex,
+    _generate_workflow_execution_ids,
+)
+from keep.workflowmanager.workflowresultsbatcher import WorkflowResultsBatcher
+from keep.workflowmanager.workflowscheduler import ThroughputManager, WorkflowScheduler
+from keep.workflowmanager.workflowstore import Trigger, WorkflowStore
 
 path_to_test_resources = Path(__file__).parent / "workflows"
 
@@ -75,6 +97,9 @@ def test_get_workflow_results():
     mock_workflow = Mock(spec=Workflow)
     mock_workflow.workflow_actions = [mock_action1, mock_action2]
     mock_workflow.workflow_steps = [mock_step1, mock_step2]
+    mock_workflow.iter_named_results = functools.partial(
+        Workflow.iter_named_results, mock_workflow
+    )
 
     workflow_manager = WorkflowManager()
     result = workflow_manager._get_workflow_results(mock_workflow)
@@ -90,6 +115,67 @@ def test_get_workflow_results():
 
 
 
+def test_apply_filter_caches_compiled_regex():
+    workflow_manager = WorkflowManager()
+    _compile_filter_regex.cache_clear()
+
+    assert workflow_manager._apply_filter('r"(payments|ftp)"', "payments")
+    assert not workflow_manager._apply_filter('r"(payments|ftp)"', "email")
+    assert _compile_filter_regex.cache_info().hits == 1
+    assert _compile_filter_regex.cache_info().misses == 1
+
+    # invalid patterns don't match and aren't retried as a new compile
+    assert workflow_manager._apply_filter('r"(unclosed"', "unclosed") is False
+    assert workflow_manager._apply_filter('r"(unclosed"', "unclosed") is False
+    assert _compile_filter_regex.cache_info().misses == 2
+
+
+def test_apply_filter_equality():
+    workflow_manager = WorkflowManager()
+    assert workflow_manager._apply_filter("payments", "payments")
+    assert not workflow_manager._apply_filter("payments", "email")
+    # bool filters match their string form, e.g. `dismissed`
+    assert workflow_manager._apply_filter(True, "True")
+    assert not workflow_manager._apply_filter(True, "False")
+    assert workflow_manager._apply_filter(False, False)
+
+
+def test_insert_incident_fetches_enrichment_once():
+    workflow_manager = WorkflowManager()
+    incident_triggers = [Trigger(type="incident", events=("created",))]
+    workflow_models = [Mock(id="workflow1"), Mock(id="workflow2")]
+    workflow_manager.workflow_store.get_workflows_by_trigger_type = Mock(
+        return_value=[(model, incident_triggers) for model in workflow_models]
+    )
+    workflow_manager._get_workflow_from_store = Mock(return_value=Mock(spec=Workflow))
+    incident = IncidentDto(
+        id="ba9ddbb9-3a83-40fc-9ace-1e026e08ca2b",
+        user_generated_name="incident",
+        alerts_count=0,
+        alert_sources=[],
+        services=[],
+        severity="critical",
+        is_predicted=False,
+        is_candidate=False,
+    )
+
+    with patch(
+        "keep.workflowmanager.workflowmanager.get_enrichment"
+    ) as mock_get_enrichment:
+        mock_get_enrichment.return_value.enrichments = {
+            "assignee": "alice",
+            "custom_field": "value",
+        }
+        workflow_manager.insert_incident("test_tenant", incident, "created")
+
+    mock_get_enrichment.assert_called_once_with(
+        "test_tenant", "ba9ddbb9-3a83-40fc-9ace-1e026e08ca2b"
+    )
+    assert incident.assignee == "alice"
+    assert incident.dict(exclude_unset=True)["custom_field"] == "value"
+    assert workflow_manager.scheduler.workflows_to_run.qsize() == 2
+
+
 def test_handle_manual_event_workflow():
     mock_workflow = Mock(spec=Workflow)
     mock_workflow.workflow_id = "workflow1"
@@ -122,8 +208,8 @@ def test_handle_manual_event_workflow():
         )
 
         assert workflow_execution_id == "test_execution_id"
-        assert len(workflow_scheduler.workflows_to_run) == 1
-        workflow_run = workflow_scheduler.workflows_to_run[0]
+        assert workflow_scheduler.workflows_to_run.qsize() == 1
+        workflow_run = workflow_scheduler._pop_workflows_to_run()[0]
         assert workflow_run["workflow_execution_id"] == "test_execution_id"
         assert workflow_run["workflow_id"] == mock_workflow.workflow_id
         assert workflow_run["tenant_id"] == tenant_id
@@ -165,7 +251,224 @@ def test_handle_manual_event_workflow_test_run():
         )
 
         assert workflow_execution_id == "test_execution_id"
-        assert len(workflow_scheduler.workflows_to_run) == 1
-        assert workflow_scheduler.workflows_to_run[0]["workflow_execution_id"] == "test_execution_id"
-        assert workflow_scheduler.workflows_to_run[0]["test_run"] == True
-        assert workflow_scheduler.workflows_to_run[0]["workflow"] == mock_workflow
+        assert workflow_scheduler.workflows_to_run.qsize() == 1
+        workflow_run = workflow_scheduler._pop_workflows_to_run()[0]
+        assert workflow_run["workflow_execution_id"] == "test_execution_id"
+        assert workflow_run["test_run"] == True
+        assert workflow_run["workflow"] == mock_workflow
+
+
+def test_workflow_results_batcher(db_session):
+    batcher = WorkflowResultsBatcher()
+    batcher.save(SINGLE_TENANT_UUID, "test-execution-id-1", {"action": ["ok"]})
+    db_session.expire_all()
+    workflow_execution = db_session.get(WorkflowExecution, "test-execution-id-1")
+    assert workflow_execution.results == {"action": ["ok"]}
+
+    with pytest.raises(NoResultFound):
+        batcher.save(SINGLE_TENANT_UUID, "missing-execution-id", {})
+    batcher.stop()
+
+
+def test_workflow_results_batcher_batches_concurrent_results():
+    first_flush_started = threading.Event()
+    release_first_flush = threading.Event()
+    batches = []
+
+    def save_workflows_results(workflows_results):
+        batches.append(workflows_results)
+        if len(batches) == 1:
+            first_flush_started.set()
+            release_first_flush.wait(5)
+        return {execution_id for _, execution_id, _ in workflows_results}
+
+    def save(execution_id):
+        thread = threading.Thread(
+            target=batcher.save, args=(SINGLE_TENANT_UUID, execution_id, {})
+        )
+        thread.start()
+        return thread
+
+    batcher = WorkflowResultsBatcher()
+    with patch(
+        "keep.workflowmanager.workflowresultsbatcher.save_workflows_results",
+        side_effect=save_workflows_results,
+    ):
+        threads = [save("execution-0")]
+        assert first_flush_started.wait(5)
+        # queued while the first batch is saved, so they are saved together
+        threads += [save(f"execution-{i}") for i in range(1, 4)]
+        deadline = time.monotonic() + 5
+        while batcher.queue.qsize() < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release_first_flush.set()
+        for thread in threads:
+            thread.join(5)
+        batcher.stop()
+
+    assert [len(batch) for batch in batches] == [1, 3]
+
+
+def test_run_workflows_from_cli_runs_workflows_concurrently():
+    workflow_manager = WorkflowManager()
+    workflows = [Mock(spec=Workflow, workflow_id=f"workflow{i}") for i in range(2)]
+    # both runs have to be in progress at once to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def run_workflow(workflow, workflow_execution_id):
+        barrier.wait()
+        return [[f"{workflow.workflow_id} error"], None]
+
+    with patch.object(workflow_manager, "_run_workflow", side_effect=run_workflow):
+        assert workflow_manager._run_workflows_from_cli(workflows) == [
+            ["workflow0 error"],
+            ["workflow1 error"],
+        ]
+
+    with patch.object(
+        workflow_manager, "_run_workflow", side_effect=ValueError("failed")
+    ):
+        with pytest.raises(ValueError):
+            workflow_manager._run_workflows_from_cli(workflows)
+
+
+def test_generate_workflow_execution_ids():
+    workflow_execution_ids = _generate_workflow_execution_ids(100)
+    assert len(set(workflow_execution_ids)) == 100
+    for workflow_execution_id in workflow_execution_ids:
+        assert uuid.UUID(workflow_execution_id).version == 4
+        assert str(uuid.UUID(workflow_execution_id)) == workflow_execution_id
+
+
+def test_get_event_value():
+    workflow_manager = WorkflowManager()
+    event = Mock(labels={"team": {"name": "payments"}, "empty": {}}, status="")
+
+    assert workflow_manager._get_event_value(event, "labels.team.name") == "payments"
+    assert workflow_manager._get_event_value(event, "labels.team.missing") is None
+    assert workflow_manager._get_event_value(event, "labels.empty.name") is None
+    assert workflow_manager._get_event_value(event, "status") == ""
+    assert workflow_manager._get_event_value(event, "status.name") is None
+
+
+def test_check_premium_providers():
+    workflow_manager = WorkflowManager()
+    workflow = Mock(spec=Workflow, workflow_providers_type=["console", "bash"])
+
+    with patch("keep.workflowmanager.workflowmanager.IS_MULTI_TENANT", False):
+        workflow_manager._check_premium_providers(workflow)
+    with patch("keep.workflowmanager.workflowmanager.IS_MULTI_TENANT", True):
+        with pytest.raises(Exception, match="Provider bash is a premium provider"):
+            workflow_manager._check_premium_providers(workflow)
+        workflow.workflow_providers_type = ["console"]
+        workflow_manager._check_premium_providers(workflow)
+
+
+def test_get_instance_is_thread_safe():
+    instances = []
+    barrier = threading.Barrier(8, timeout=5)
+
+    def get_instance():
+        barrier.wait()
+        instances.append(WorkflowManager.get_instance())
+
+    with patch.object(WorkflowManager, "_instance", create=True):
+        del WorkflowManager._instance
+        with patch.object(
+            WorkflowManager, "__init__", side_effect=lambda: time.sleep(0.1)
+        ) as mock_init:
+            threads = [threading.Thread(target=get_instance) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+        assert mock_init.call_count == 1
+        assert len({id(instance) for instance in instances}) == 1
+
+
+def test_workflow_context_filter_reads_workflow_context():
+    def make_record(level=logging.INFO):
+        return logging.LogRecord("test", level, __file__, 0, "message", None, None)
+
+    def run_in_workflow_context():
+        workflow_id_var.set("workflow1")
+        workflow_execution_id_var.set("execution1")
+        tenant_id_var.set("tenant1")
+        step_id_var.set("step1")
+        record = make_record()
+        assert WorkflowContextFilter().filter(record)
+        # DEBUG logs are only kept in workflow debug mode
+        assert not WorkflowContextFilter().filter(make_record(logging.DEBUG))
+        return record
+
+    # records outside of a workflow run are filtered out
+    assert not WorkflowContextFilter().filter(make_record())
+    record = contextvars.copy_context().run(run_in_workflow_context)
+    assert record.workflow_id == "workflow1"
+    assert record.workflow_execution_id == "execution1"
+    assert record.tenant_id == "tenant1"
+    assert record.context == {"step_id": "step1"}
+    assert workflow_id_var.get() is None
+
+
+def test_throughput_manager():
+    throughput = ThroughputManager(window=60)
+    throughput.record(30, now=1000)
+    throughput.record(60, now=1030)
+    assert throughput.average(now=1030) == 1.5
+    # the first bucket is out of the window, and its slot is reused
+    assert throughput.average(now=1060) == 1
+    throughput.record(6, now=1060)
+    assert throughput.average(now=1060) == 1.1
+
+
+def test_autoscale_workers():
+    workflow_scheduler = WorkflowScheduler(workflow_manager=Mock())
+    workflow_scheduler.max_concurrency = 2
+    workflow_scheduler.throughput = Mock()
+
+    # scales up to the throughput at once, within the workers limit
+    workflow_scheduler.throughput.average.return_value = 7.5
+    workflow_scheduler._autoscale_workers()
+    assert workflow_scheduler.max_concurrency == 8
+    workflow_scheduler.throughput.average.return_value = 1000
+    workflow_scheduler._autoscale_workers()
+    assert workflow_scheduler.max_concurrency == WorkflowScheduler.MAX_WORKERS
+
+    # and down one step at a time, not below the minimum
+    workflow_scheduler.max_concurrency = 8
+    workflow_scheduler.throughput.average.return_value = 7.5
+    workflow_scheduler._autoscale_workers()
+    assert workflow_scheduler.max_concurrency == 8
+    workflow_scheduler.throughput.average.return_value = 0
+    workflow_scheduler._autoscale_workers()
+    assert workflow_scheduler.max_concurrency == 7
+    for _ in range(10):
+        workflow_scheduler._autoscale_workers()
+    assert workflow_scheduler.max_concurrency == WorkflowScheduler.MIN_WORKERS
+    workflow_scheduler.executor.shutdown()
+
+
+def test_autoscaled_event_workflows_wait_for_concurrency():
+    workflow_scheduler = WorkflowScheduler(workflow_manager=Mock())
+    workflow_scheduler.max_concurrency = 2
+    workflow_scheduler.futures = {Mock()}
+    workflow_scheduler.throughput = Mock()
+    for i in range(3):
+        workflow_scheduler.workflows_to_run.put(
+            {"workflow_id": f"workflow{i}", "tenant_id": "test_tenant"}
+        )
+
+    with patch.object(WorkflowScheduler, "AUTOSCALE_WORKERS", True), patch.object(
+        workflow_scheduler.workflow_store,
+        "get_workflow",
+        side_effect=HTTPException(status_code=404),
+    ), patch.object(workflow_scheduler, "_finish_workflow_execution"):
+        workflow_scheduler._handle_event_workflows()
+
+    # one slot was free, the other workflows are deferred to the next round
+    workflow_scheduler.throughput.record.assert_called_once_with(3)
+    deferred = workflow_scheduler._pop_workflows_to_run()
+    assert [w["workflow_id"] for w in deferred] == ["workflow1", "workflow2"]
+    assert all(w["deferred"] for w in deferred)
+    workflow_scheduler.executor.shutdown()
@@ -1,6 +1,18 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from keep.api.core.db import get_all_workflows
 from keep.api.core.dependencies import SINGLE_TENANT_UUID
 from keep.api.models.db.workflow import Workflow
-from keep.workflowmanager.workflowstore import WorkflowStore
+from keep.workflowmanager.workflowstore import (
+    Trigger,
+    TriggerFilter,
+    WorkflowStore,
+    _apply_literal_filter,
+)
+from tests.fixtures.client import client, setup_api_key, test_app  # noqa: F401
 
 VALID_WORKFLOW = """
 id: retrieve-cloudwatch-logs
@@ -100,3 +112,299 @@ def test_get_workflow_meta_data_3832():
 
     assert len(providers_dto) == 1
     assert providers_dto[0].type == "cloudwatch"
+
+
+def test_get_workflows_by_trigger_type(db_session):
+    incident_workflow = """workflow:
+  id: incident-workflow
+  triggers:
+    - type: incident
+      events:
+        - created
+    - type: manual
+"""
+    workflows = [
+        Workflow(
+            id=workflow_id,
+            name=workflow_id,
+            tenant_id=SINGLE_TENANT_UUID,
+            created_by="test@keephq.dev",
+            interval=0,
+            is_disabled=is_disabled,
+            workflow_raw=workflow_raw,
+        )
+        for workflow_id, workflow_raw, is_disabled in [
+            ("incident-workflow", incident_workflow, False),
+            ("disabled-incident-workflow", incident_workflow, True),
+            ("manual-workflow", VALID_WORKFLOW, False),
+        ]
+    ]
+    db_session.add_all(workflows)
+    db_session.commit()
+
+    workflow_store = WorkflowStore()
+    incident_workflows = workflow_store.get_workflows_by_trigger_type(
+        SINGLE_TENANT_UUID, "incident"
+    )
+    assert [(w.id, triggers) for w, triggers in incident_workflows] == [
+        ("incident-workflow", [Trigger(type="incident", events=("created",))])
+    ]
+    manual_workflows = workflow_store.get_workflows_by_trigger_type(
+        SINGLE_TENANT_UUID, "manual"
+    )
+    assert sorted(w.id for w, _ in manual_workflows) == [
+        "incident-workflow",
+        "manual-workflow",
+    ]
+
+    # the index follows changes of the workflow yaml
+    workflows[0].workflow_raw = incident_workflow.replace("created", "updated")
+    workflows[0].last_updated = datetime.utcnow()
+    db_session.add(workflows[0])
+    db_session.commit()
+    incident_workflows = WorkflowStore().get_workflows_by_trigger_type(
+        SINGLE_TENANT_UUID, "incident"
+    )
+    assert incident_workflows[0][1] == [Trigger(type="incident", events=("updated",))]
+
+
+def test_get_workflows_by_trigger_type_caches_workflows(db_session):
+    def add_workflow(workflow_id):
+        db_session.add(
+            Workflow(
+                id=workflow_id,
+                name=workflow_id,
+                tenant_id=SINGLE_TENANT_UUID,
+                created_by="test@keephq.dev",
+                interval=0,
+                workflow_raw=VALID_WORKFLOW,
+            )
+        )
+        db_session.commit()
+
+    add_workflow("workflow-1")
+    workflow_store = WorkflowStore()
+    with patch(
+        "keep.workflowmanager.workflowstore.get_all_workflows",
+        wraps=get_all_workflows,
+    ) as mock_get_all_workflows:
+        for _ in range(3):
+            workflows = workflow_store.get_workflows_by_trigger_type(
+                SINGLE_TENANT_UUID, "manual"
+            )
+            assert [w.id for w, _ in workflows] == ["workflow-1"]
+        assert mock_get_all_workflows.call_count == 1
+
+        # a new workflow changes the version and reloads the workflows
+        add_workflow("workflow-2")
+        workflows = workflow_store.get_workflows_by_trigger_type(
+            SINGLE_TENANT_UUID, "manual"
+        )
+        assert sorted(w.id for w, _ in workflows) == ["workflow-1", "workflow-2"]
+        assert mock_get_all_workflows.call_count == 2
+
+
+@pytest.mark.parametrize("test_app", ["NO_AUTH"], indirect=True)
+def test_toggle_workflow_updates_dispatch(db_session, client, test_app):
+    incident_workflow = """workflow:
+  id: incident-workflow
+  triggers:
+    - type: incident
+      events:
+        - created
+"""
+    db_session.add_all(
+        [
+            Workflow(
+                id="incident-workflow",
+                name="incident-workflow",
+                tenant_id=SINGLE_TENANT_UUID,
+                created_by="test@keephq.dev",
+                interval=0,
+                workflow_raw=incident_workflow,
+            ),
+            # a newer last_updated than the toggle writes, the version must still change
+            Workflow(
+                id="manual-workflow",
+                name="manual-workflow",
+                tenant_id=SINGLE_TENANT_UUID,
+                created_by="test@keephq.dev",
+                interval=0,
+                workflow_raw=VALID_WORKFLOW,
+                last_updated=datetime.utcnow() + timedelta(days=1),
+            ),
+        ]
+    )
+    db_session.commit()
+
+    def dispatched_workflow_ids():
+        return [
+            w.id
+            for w, _ in WorkflowStore().get_workflows_by_trigger_type(
+                SINGLE_TENANT_UUID, "incident"
+            )
+        ]
+
+    assert dispatched_workflow_ids() == ["incident-workflow"]
+    response = client.put(
+        "/workflows/incident-workflow/toggle", headers={"x-api-key": "some-key"}
+    )
+    assert response.status_code == 200
+    assert dispatched_workflow_ids() == []
+    response = client.put(
+        "/workflows/incident-workflow/toggle", headers={"x-api-key": "some-key"}
+    )
+    assert response.status_code == 200
+    assert dispatched_workflow_ids() == ["incident-workflow"]
+
+
+def test_get_workflows_by_trigger_type_cache_expires(db_session):
+    db_session.add(
+        Workflow(
+            id="workflow-1",
+            name="workflow-1",
+            tenant_id=SINGLE_TENANT_UUID,
+            created_by="test@keephq.dev",
+            interval=0,
+            workflow_raw=VALID_WORKFLOW,
+        )
+    )
+    db_session.commit()
+
+    workflow_store = WorkflowStore()
+    with patch(
+        "keep.workflowmanager.workflowstore.get_all_workflows",
+        wraps=get_all_workflows,
+    ) as mock_get_all_workflows:
+        workflow_store.get_workflows_by_trigger_type(SINGLE_TENANT_UUID, "manual")
+        workflow_store.get_workflows_by_trigger_type(SINGLE_TENANT_UUID, "manual")
+        assert mock_get_all_workflows.call_count == 1
+        with patch("keep.workflowmanager.workflowstore.WORKFLOWS_CACHE_TTL", 0):
+            workflow_store._invalidate_workflows_cache(SINGLE_TENANT_UUID)
+            workflow_store.get_workflows_by_trigger_type(SINGLE_TENANT_UUID, "manual")
+            workflow_store.get_workflows_by_trigger_type(SINGLE_TENANT_UUID, "manual")
+        assert mock_get_all_workflows.call_count == 3
+
+
+def test_user_assigned_trigger_filters():
+    user_assigned_workflow = """workflow:
+  id: user-assigned-workflow
+  triggers:
+    - type: user_assigned
+      filters:
+        - key: mentioned_user
+          value: r"^oncall-.*"
+        - key: mentioned_by
+          value: bot@keephq.dev
+          exclude: true
+    - type: user_assigned
+      filters:
+        - key: mentioned_user
+          value: admin@keephq.dev
+"""
+    workflow = Workflow(
+        id="user-assigned-workflow",
+        name="user-assigned-workflow",
+        tenant_id=SINGLE_TENANT_UUID,
+        created_by="test@keephq.dev",
+        interval=0,
+        workflow_raw=user_assigned_workflow,
+    )
+    workflow_store = WorkflowStore()
+    triggers = workflow_store._get_triggers_by_type(workflow)["user_assigned"]
+    assert len(triggers) == 2
+    assert triggers[0].filters[1] == TriggerFilter(
+        key="mentioned_by",
+        value="bot@keephq.dev",
+        exclude=True,
+        value_matches=triggers[0].filters[1].value_matches,
+    )
+
+    def matches(data):
+        return any(trigger.matches(data) for trigger in triggers)
+
+    assert matches({"mentioned_user": "oncall-1", "mentioned_by": "me@keephq.dev"})
+    assert matches({"mentioned_user": "admin@keephq.dev"})
+    assert not matches({"mentioned_user": "oncall-1", "mentioned_by": "bot@keephq.dev"})
+    # a filter key missing from the data doesn't match
+    assert not matches({"mentioned_user": "oncall-1"})
+    assert not matches({"mentioned_user": "someone@keephq.dev"})
+
+    # compiled once per workflow revision
+    assert workflow_store._get_triggers_by_type(workflow)["user_assigned"] is triggers
+    workflow.workflow_raw = user_assigned_workflow.replace("admin@", "root@")
+    triggers = WorkflowStore()._get_triggers_by_type(workflow)["user_assigned"]
+    assert matches({"mentioned_user": "root@keephq.dev"})
+    assert not matches({"mentioned_user": "admin@keephq.dev"})
+
+
+def test_triggers_index_is_bounded():
+    workflow_store = WorkflowStore()
+    workflows = [
+        Workflow(
+            id=f"workflow-{i}",
+            name=f"workflow-{i}",
+            tenant_id=SINGLE_TENANT_UUID,
+            created_by="test@keephq.dev",
+            interval=0,
+            workflow_raw=VALID_WORKFLOW,
+        )
+        for i in range(3)
+    ]
+    with patch("keep.workflowmanager.workflowstore.TRIGGERS_INDEX_MAX_WORKFLOWS", 2):
+        triggers = workflow_store._get_triggers_by_type(workflows[0])
+        workflow_store._get_triggers_by_type(workflows[1])
+        # a hit keeps workflow-0 as the most recently used one
+        assert workflow_store._get_triggers_by_type(workflows[0]) is triggers
+        workflow_store._get_triggers_by_type(workflows[2])
+    assert "workflow-0" in workflow_store._triggers_index
+    assert "workflow-1" not in workflow_store._triggers_index
+    assert len(workflow_store._triggers_index) <= 2
+
+
+def test_get_all_workflows_filters_disabled(db_session):
+    db_session.add_all(
+        [
+            Workflow(
+                id=workflow_id,
+                name=workflow_id,
+                tenant_id=SINGLE_TENANT_UUID,
+                created_by="test@keephq.dev",
+                interval=0,
+                is_disabled=is_disabled,
+                workflow_raw=VALID_WORKFLOW,
+            )
+            for workflow_id, is_disabled in [
+                ("enabled-workflow", False),
+                ("disabled-workflow", True),
+            ]
+        ]
+    )
+    db_session.commit()
+
+    workflow_store = WorkflowStore()
+    workflow_ids = {w.id for w in workflow_store.get_all_workflows(SINGLE_TENANT_UUID)}
+    assert "enabled-workflow" in workflow_ids
+    assert "disabled-workflow" not in workflow_ids
+    workflow_ids = {
+        w.id
+        for w in workflow_store.get_all_workflows(
+            SINGLE_TENANT_UUID, include_disabled=True
+        )
+    }
+    assert {"enabled-workflow", "disabled-workflow"} <= workflow_ids
+
+
+def test_compile_filter_literal_regex_fast_path():
+    workflow_store = WorkflowStore()
+    literal_filter = workflow_store._compile_filter('r"payments"')
+    assert literal_filter.func is _apply_literal_filter
+    assert literal_filter("team-payments-eu")
+    assert not literal_filter("email")
+    # non string values fail like they do with the regex
+    assert literal_filter(["payments"]) is False
+
+    regex_filter = workflow_store._compile_filter('r"^pay.*s$"')
+    assert regex_filter.func is not _apply_literal_filter
+    assert regex_filter("payments")
+    assert not regex_filter("team-payments-eu")